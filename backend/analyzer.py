@@ -1,4 +1,8 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+import os
 import time
 from dataclasses import dataclass
 from langdetect import detect, LangDetectException
@@ -6,15 +10,29 @@ import spacy
 import simplemma
 
 from languages import get_language, get_spacy_models
-from languages.base import LanguageAnalysis
+from languages.base import LanguageAnalysis, LanguageModule, token_index
 from timing import record_timing
 
+try:
+    import fasttext
+except ImportError:
+    fasttext = None
+
 log = logging.getLogger(__name__)
 
+# Path to fastText's language-id model (lid.176.ftz / lid.176.bin). When set
+# and fasttext is installed it replaces langdetect, which is pure Python.
+LID_MODEL_PATH_ENV = "FASTTEXT_LID_PATH"
+
+_lid_model = None
+
 _models: dict[str, spacy.Language] = {}
+# PID of the process that ran preload_models(). Workers forked from it share
+# the model pages copy-on-write; a model loaded after the fork is private.
+_preload_pid: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WordAnalysis:
     text: str
     lemma: str
@@ -25,8 +43,31 @@ class WordAnalysis:
     lang_analysis: LanguageAnalysis | None = None
 
 
+# Detection only looks at this many characters of (whitespace-normalized) text
+_DETECT_MAX_CHARS = 200
+
+
 def detect_language(text: str) -> str:
     """Detect language of text. Returns ISO 639-1 code (e.g., 'de', 'en')."""
+    return _detect_cached(" ".join(text.split())[:_DETECT_MAX_CHARS])
+
+
+def detect_language_for_request(text: str, context: str = "") -> str:
+    """Resolve the source language once per request, the way analyze_word
+    would for source_lang='auto' (context preferred over the word itself)."""
+    start = time.perf_counter()
+    lang = detect_language(context if context else text)
+    record_timing("language detection", (time.perf_counter() - start) * 1000)
+    return lang
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_cached(text: str) -> str:
+    if _lid_model is not None:
+        labels, _ = _lid_model.predict(text, k=1)
+        lang = labels[0].removeprefix("__label__")
+        log.debug(f"[LANG] Detected language: {lang} for text: '{text[:30]}...'")
+        return lang
     try:
         lang = detect(text)
         log.debug(f"[LANG] Detected language: {lang} for text: '{text[:30]}...'")
@@ -36,6 +77,43 @@ def detect_language(text: str) -> str:
         return "en"
 
 
+def _load_lid_model() -> None:
+    """Load the fastText language-id model if installed and configured."""
+    global _lid_model
+    path = os.environ.get(LID_MODEL_PATH_ENV, "").strip()
+    if not path:
+        return
+    if fasttext is None:
+        log.warning(f"[LANG] {LID_MODEL_PATH_ENV} is set but fasttext isn't installed; using langdetect")
+        return
+    try:
+        _lid_model = fasttext.load_model(path)
+    except ValueError as e:
+        log.warning(f"[LANG] Failed to load fastText model {path}: {e}; using langdetect")
+        return
+    _detect_cached.cache_clear()
+    log.info(f"[LANG] Using fastText language id: {path}")
+
+
+# Pipeline components that are only loaded when a language module asks for them
+# (LanguageModule.required_components). Lemma/POS/morph never need them.
+_OPTIONAL_COMPONENTS = ("parser", "ner", "senter")
+
+
+def _load_model(lang: str, model_name: str) -> spacy.Language:
+    """Load a spaCy model without the components the analyzer doesn't read.
+
+    Unneeded components are excluded rather than disabled: nothing re-enables
+    them, so there's no point constructing them and deserializing their weights.
+    """
+    lang_module = get_language(lang)
+    required = lang_module.required_components if lang_module else ()
+    exclude = [c for c in _OPTIONAL_COMPONENTS if c not in required]
+    nlp = spacy.load(model_name, exclude=exclude)
+    log.info(f"[SPACY] {model_name} pipeline: {nlp.pipe_names}")
+    return nlp
+
+
 def get_model(lang: str) -> spacy.Language | None:
     """Get spaCy model for language, loading lazily."""
     spacy_models = get_spacy_models()
@@ -44,9 +122,12 @@ def get_model(lang: str) -> spacy.Language | None:
         return None
 
     if lang not in _models:
+        if _preload_pid is not None and _preload_pid != os.getpid():
+            log.warning(f"[SPACY] Loading {spacy_models[lang]} after fork (pid {os.getpid()}); "
+                        f"its memory won't be shared with other workers")
         try:
             log.info(f"[SPACY] Loading model: {spacy_models[lang]}")
-            _models[lang] = spacy.load(spacy_models[lang])
+            _models[lang] = _load_model(lang, spacy_models[lang])
             log.info(f"[SPACY] Model loaded successfully")
         except OSError as e:
             log.error(f"[SPACY] Failed to load model: {e}")
@@ -56,39 +137,72 @@ def get_model(lang: str) -> spacy.Language | None:
 
 
 def preload_models() -> None:
-    """Preload all spaCy models and warm up language detection at startup."""
+    """Preload all spaCy models and warm up language detection at startup.
+
+    With a pre-forking server (e.g. gunicorn --preload), call this in the
+    master before workers fork so the read-only model pages are shared
+    copy-on-write instead of loaded once per worker.
+    """
+    global _preload_pid
     log.info("[PRELOAD] Starting model preload...")
 
-    # Warm up langdetect (loads its models on first call)
-    try:
-        detect("hello world")
-        log.info("[PRELOAD] Language detection warmed up")
-    except LangDetectException:
-        pass
+    _load_lid_model()
+    if _lid_model is None:
+        # Warm up langdetect (loads its models on first call)
+        try:
+            detect("hello world")
+            log.info("[PRELOAD] Language detection warmed up")
+        except LangDetectException:
+            pass
 
-    # Preload all spaCy models
+    # Load spaCy models and warm language resources concurrently: model loading
+    # is mostly file I/O and numpy deserialization, which release the GIL
     spacy_models = get_spacy_models()
-    for lang, model_name in spacy_models.items():
-        if lang not in _models:
+    pending = {lang: name for lang, name in spacy_models.items() if lang not in _models}
+    with ThreadPoolExecutor(max_workers=min(4, len(spacy_models) + 1)) as ex:
+        warm_ups = [ex.submit(get_language(lang).warm_up) for lang in spacy_models]
+        futures = {}
+        for lang, model_name in pending.items():
+            log.info(f"[PRELOAD] Loading spaCy model: {model_name}")
+            futures[ex.submit(_load_model, lang, model_name)] = (lang, model_name)
+        for fut in as_completed(futures):
+            lang, model_name = futures[fut]
             try:
-                log.info(f"[PRELOAD] Loading spaCy model: {model_name}")
-                _models[lang] = spacy.load(model_name)
+                _models[lang] = fut.result()
             except OSError as e:
                 log.warning(f"[PRELOAD] Failed to load {model_name}: {e}")
+        for fut in warm_ups:
+            fut.result()
 
+    _preload_pid = os.getpid()
     log.info(f"[PRELOAD] Completed. Loaded {len(_models)} spaCy models")
 
 
-def parse_morphology(morph) -> dict[str, str]:
-    """Parse spaCy morphology into a dict."""
+@functools.lru_cache(maxsize=8192)
+def _parse_morph_cached(morph_str: str) -> dict[str, str]:
+    """Parse a canonical spaCy morph string ("Case=Nom|Number=Sing") once.
+
+    The returned dict is shared between callers: read it, don't modify it.
+    """
     result = {}
-    for item in morph:
-        if "=" in item:
-            key, val = item.split("=", 1)
-            result[key] = val
+    for item in morph_str.split("|"):
+        key, sep, val = item.partition("=")
+        if sep:
+            # Multi-valued features ("Person=1,3"): keep the last value, as
+            # iterating the MorphAnalysis does
+            result[key] = val.rpartition(",")[2]
     return result
 
 
+def parse_morphology(morph) -> dict[str, str]:
+    """Parse spaCy morphology into a dict.
+
+    Parsing is cached on str(morph); a fresh dict is returned each call so
+    callers may modify it freely.
+    """
+    return dict(_parse_morph_cached(str(morph)))
+
+
 def fix_german_verb_morph(token, morph: dict, doc) -> dict:
     """Fix verb Person/Number from the subject pronoun's spaCy morph.
 
@@ -106,7 +220,8 @@ def fix_german_verb_morph(token, morph: dict, doc) -> dict:
     for t in doc:
         if t.pos_ != "PRON":
             continue
-        pron_morph = parse_morphology(t.morph)
+        # Read-only lookup: no need for parse_morphology's private copy
+        pron_morph = _parse_morph_cached(str(t.morph))
         person = pron_morph.get("Person")
         number = pron_morph.get("Number")
         if person and number:
@@ -115,10 +230,9 @@ def fix_german_verb_morph(token, morph: dict, doc) -> dict:
     return morph
 
 
-def classify_word_type(token, lang: str, effective_pos: str | None = None, corrected_morph: dict | None = None) -> str:
-    """Classify word type based on POS and morphology."""
+def classify_word_type(token, lang_module: LanguageModule | None, morph: dict[str, str], effective_pos: str | None = None) -> str:
+    """Classify word type based on POS and (already parsed) morphology."""
     pos = effective_pos or token.pos_
-    morph = corrected_morph if corrected_morph is not None else parse_morphology(token.morph)
 
     # Verbs with tense/mood markers (excluding bare infinitives)
     if pos == "VERB" and any(k in morph for k in ["Tense", "Mood", "VerbForm"]):
@@ -130,7 +244,6 @@ def classify_word_type(token, lang: str, effective_pos: str | None = None, corre
 
     # Nouns - use language module for classification
     if pos == "NOUN":
-        lang_module = get_language(lang)
         if lang_module:
             return lang_module.classify_noun(token, morph)
         # Fallback for unsupported languages
@@ -144,6 +257,36 @@ def classify_word_type(token, lang: str, effective_pos: str | None = None, corre
     return "simple"
 
 
+# Batch size for nlp.pipe when analyzing several words at once
+_PIPE_BATCH_SIZE = 32
+
+
+def _unknown_analysis(text: str, lang: str) -> WordAnalysis:
+    """Fallback analysis when no model or token is available."""
+    return WordAnalysis(
+        text=text,
+        lemma=text.lower(),
+        pos="UNKNOWN",
+        morph={},
+        lang=lang,
+        word_type="simple",
+    )
+
+
+def _find_token(doc, text_lower: str, text_offset: int | None = None):
+    """Find the selected word in a parsed context, or None if absent."""
+    by_text, by_offset = token_index(doc)
+    if text_offset is not None:
+        # Use character offset to find the exact token (handles duplicate words)
+        i = by_offset.get(text_offset)
+        if i is not None and doc[i].text.lower() == text_lower:
+            return doc[i]
+
+    # Fallback: find by text match (first occurrence)
+    i = by_text.get(text_lower)
+    return doc[i] if i is not None else None
+
+
 def analyze_word(text: str, context: str = "", source_lang: str = "auto", text_offset: int | None = None) -> WordAnalysis:
     """Analyze a word using spaCy.
 
@@ -154,69 +297,82 @@ def analyze_word(text: str, context: str = "", source_lang: str = "auto", text_o
         text_offset: Character offset of the word within the context string.
                      Used to disambiguate when the same word appears multiple times.
     """
-    start = time.perf_counter()
+    return analyze_words([(text, context, source_lang, text_offset)])[0]
 
-    # Detect language if auto
-    if source_lang == "auto":
-        # Use context for better detection if available
-        lang = detect_language(context if context else text)
-        record_timing("language detection", (time.perf_counter() - start) * 1000)
-    else:
-        lang = source_lang
 
-    spacy_start = time.perf_counter()
-    nlp = get_model(lang)
-    record_timing("spaCy get_model", (time.perf_counter() - spacy_start) * 1000)
+async def analyze_word_async(text: str, context: str = "", source_lang: str = "auto", text_offset: int | None = None) -> WordAnalysis:
+    """analyze_word on a worker thread, so async handlers don't block the event
+    loop while spaCy runs (its numeric kernels release the GIL)."""
+    return await asyncio.to_thread(analyze_word, text, context, source_lang, text_offset)
 
+
+def analyze_words(items: list[tuple]) -> list[WordAnalysis]:
+    """Analyze several words, parsing each distinct context only once.
+
+    Args:
+        items: (text, context, source_lang) tuples, optionally with a fourth
+               text_offset element (see analyze_word).
+
+    Returns:
+        One WordAnalysis per item, in input order.
+    """
+    resolved = []
+    for item in items:
+        text, context, source_lang, *rest = item
+        text_offset = rest[0] if rest else None
+
+        # Detect language if auto (callers that know it should pass it in)
+        if source_lang == "auto":
+            lang = detect_language_for_request(text, context)
+        else:
+            lang = source_lang
+        resolved.append((text, context, lang, text_offset))
+
+    # Deduplicate contexts per language so each sentence is parsed once
+    contexts_by_lang: dict[str, dict[str, None]] = {}
+    for _, context, lang, _ in resolved:
+        if context:
+            contexts_by_lang.setdefault(lang, {})[context] = None
+
+    docs: dict[tuple[str, str], spacy.tokens.Doc] = {}
+    for lang, unique_contexts in contexts_by_lang.items():
+        ctxs = list(unique_contexts)
+        spacy_start = time.perf_counter()
+        nlp = get_model(lang)
+        record_timing("spaCy get_model", (time.perf_counter() - spacy_start) * 1000)
+        if nlp is None:
+            continue
+        parsed = nlp.pipe(ctxs, batch_size=_PIPE_BATCH_SIZE)
+        for ctx, doc in zip(ctxs, parsed):
+            docs[(lang, ctx)] = doc
+
+    return [
+        _analyze_resolved(text, context, lang, text_offset, docs.get((lang, context)))
+        for text, context, lang, text_offset in resolved
+    ]
+
+
+def _analyze_resolved(text: str, context: str, lang: str, text_offset: int | None, doc) -> WordAnalysis:
+    """Analyze one word once its language is known and its context parsed."""
+    nlp = get_model(lang)
     if nlp is None:
         # Fallback if no model available
-        return WordAnalysis(
-            text=text,
-            lemma=text.lower(),
-            pos="UNKNOWN",
-            morph={},
-            lang=lang,
-            word_type="simple",
-        )
+        return _unknown_analysis(text, lang)
+    lang_module = get_language(lang)
 
     # Analyze the word (use context if available for better accuracy)
-    if context:
-        doc = nlp(context)
+    token = None
+    if context and doc is not None:
         # Find our word in the context
-        token = None
-        text_lower = text.lower()
-
-        if text_offset is not None:
-            # Use character offset to find the exact token (handles duplicate words)
-            for t in doc:
-                if t.idx == text_offset and t.text.lower() == text_lower:
-                    token = t
-                    break
-
-        if token is None:
-            # Fallback: find by text match (first occurrence)
-            for t in doc:
-                if t.text.lower() == text_lower:
-                    token = t
-                    break
-
-        if token is None:
-            # Word not found in context, analyze alone
-            doc = nlp(text)
-            token = doc[0] if doc else None
-    else:
+        token = _find_token(doc, text.lower(), text_offset)
+
+    if token is None:
+        # Word not found in context (or no context), analyze alone
         doc = nlp(text)
         token = doc[0] if doc else None
 
     if token is None:
-        return WordAnalysis(
-            text=text,
-            lemma=text.lower(),
-            pos="UNKNOWN",
-            morph={},
-            lang=lang,
-            word_type="simple",
-        )
+        return _unknown_analysis(text, lang)
 
     # Correct spaCy POS for German: if tagged NOUN but the token is lowercase
     # and simplemma gives a verb lemma, it's a verb misclassified by de_core_news_lg
@@ -235,14 +391,13 @@ def analyze_word(text: str, context: str = "", source_lang: str = "auto", text_o
         morph = fix_german_verb_morph(token, morph, doc)
 
     # Run language-specific analysis (separable verbs, collocations, compound tenses, etc.)
-    lang_module = get_language(lang)
     lang_analysis = None
     if lang_module and context:
         lang_analysis = lang_module.analyze(text, token, doc, morph, nlp)
 
     # word_type: language analysis overrides generic POS-based classification
     word_type = (lang_analysis.word_type if lang_analysis and lang_analysis.word_type
-                 else classify_word_type(token, lang, effective_pos, morph))
+                 else classify_word_type(token, lang_module, morph, effective_pos))
 
     # Use simplemma for verbs — more reliable for irregular forms (e.g. schloss → schließen)
     if lang == "de" and effective_pos == "VERB":
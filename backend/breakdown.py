@@ -1,5 +1,12 @@
+import functools
+
 from analyzer import WordAnalysis, get_model, parse_morphology
-from languages.base import describe_morphology
+from languages.base import make_morph_describer
+
+_describe_verb_morph = make_morph_describer(["Tense", "Person", "Number", "Mood"])
+_describe_noun_morph = make_morph_describer(["Gender", "Number", "Case"])
+_describe_gender_case = make_morph_describer(["Gender", "Case"])
+_describe_adjective_morph = make_morph_describer(["Gender", "Case", "Number"])
 
 # Definite articles by language, case and gender
 _ARTICLES: dict[str, dict[str, dict[str, str]]] = {
@@ -42,7 +49,7 @@ def generate_verb_breakdown(analysis: WordAnalysis, lemma_translation: str) -> s
     if analysis.word_type != "conjugated_verb":
         return None
 
-    morph_desc = describe_morphology(analysis.morph, include=["Tense", "Person", "Number", "Mood"])
+    morph_desc = _describe_verb_morph(analysis.morph)
     if morph_desc:
         return f"{analysis.lemma} ({lemma_translation}) → {analysis.text} ({morph_desc})"
 
@@ -56,7 +63,7 @@ def generate_noun_breakdown(analysis: WordAnalysis, translation: str) -> str | N
 
     gender = analysis.morph.get("Gender")
     case = analysis.morph.get("Case")
-    morph_desc = describe_morphology(analysis.morph, include=["Gender", "Number", "Case"])
+    morph_desc = _describe_noun_morph(analysis.morph)
     if not morph_desc:
         return None
 
@@ -74,7 +81,7 @@ def generate_plural_breakdown(analysis: WordAnalysis, singular_translation: str)
     lemma = analysis.lemma
 
     gender = analysis.morph.get("Gender")
-    case_desc = describe_morphology(analysis.morph, include=["Gender", "Case"])
+    case_desc = _describe_gender_case(analysis.morph)
     morph_parts = [case_desc] if case_desc else []
     morph_parts.append("plural")
     morph_desc = ", ".join(morph_parts)
@@ -93,7 +100,18 @@ def _get_part_gender(base: str, lang: str) -> str | None:
     nlp = get_model(lang)
     if not nlp:
         return None
-    doc = nlp(base)
+    return _part_gender_lookup(base, lang)
+
+
+@functools.lru_cache(maxsize=4096)
+def _part_gender_lookup(base: str, lang: str) -> str | None:
+    """Run the spaCy lookup behind _get_part_gender.
+
+    Cached: each lookup runs the full pipeline on the part, and the same
+    bases (Haus, Zeit, Arbeit...) recur across many compounds. Only called
+    once a model is available, so a failed model load isn't memoized.
+    """
+    doc = get_model(lang)(base)
     if not doc:
         return None
     token = doc[0]
@@ -129,14 +147,14 @@ def generate_compound_breakdown(
     lang = analysis.lang if analysis else ""
 
     # Format each part with its article: "der Zapfen (robinet) + die Säule (colonne)"
-    parts_str = " + ".join(
+    parts_str = " + ".join([
         _format_compound_part(base, trans, lang)
         for _, base, trans in compound_parts
-    )
+    ])
 
     # Add whole-word morphology info if available (gender, number, case)
     if analysis:
-        morph_desc = describe_morphology(analysis.morph, include=["Gender", "Number", "Case"])
+        morph_desc = _describe_noun_morph(analysis.morph)
         if morph_desc:
             article = _get_article(analysis.lang, analysis.morph.get("Case"), analysis.morph.get("Gender"))
             prefix = f"{article} " if article else ""
@@ -164,7 +182,7 @@ def generate_adjective_breakdown(analysis: WordAnalysis, translation: str) -> st
     gender = analysis.morph.get("Gender")
     case = analysis.morph.get("Case")
     if gender or case:
-        case_gender = describe_morphology(analysis.morph, include=["Gender", "Case", "Number"])
+        case_gender = _describe_adjective_morph(analysis.morph)
         if case_gender:
             morph_parts.append(case_gender)
 
@@ -1,6 +1,8 @@
+import functools
 import hashlib
 import json
 import logging
+import threading
 from dataclasses import asdict, dataclass
 
 import redis
@@ -22,7 +24,7 @@ def get_redis() -> redis.Redis:
     return _client
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedTranslation:
     translation: str
     meaning: str | None
@@ -35,17 +37,44 @@ class CachedTranslation:
     verb_variant: str | None = None
 
 
+def _digest(normalized: str) -> str:
+    """16-hex-char key digest. Not security-sensitive, so BLAKE2b with an
+    8-byte digest is enough and cheaper than a truncated SHA-256."""
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_context(context: str) -> str:
+    """Lowercase and collapse whitespace. Cached because one request builds
+    several keys (word get/set, context get/set) from the same sentence."""
+    return " ".join(context.lower().split())
+
+
 class TranslationCache:
+    def __init__(self) -> None:
+        # Per-process hit/miss counters; requests run on executor threads
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
     def _word_key(self, word: str, context: str, source_lang: str, target_lang: str) -> str:
-        normalized = f"{word.lower()}:{' '.join(context.lower().split())}:{source_lang}:{target_lang}"
-        return "word:" + hashlib.sha256(normalized.encode()).hexdigest()[:16]
+        normalized = f"{word.lower()}:{_normalize_context(context)}:{source_lang}:{target_lang}"
+        return "word:" + _digest(normalized)
 
     def _context_key(self, context: str, source_lang: str, target_lang: str) -> str:
-        normalized = f"{' '.join(context.lower().split())}:{source_lang}:{target_lang}"
-        return "ctx:" + hashlib.sha256(normalized.encode()).hexdigest()[:16]
+        normalized = f"{_normalize_context(context)}:{source_lang}:{target_lang}"
+        return "ctx:" + _digest(normalized)
 
     def get(self, word: str, context: str, source_lang: str, target_lang: str) -> CachedTranslation | None:
         raw = get_redis().get(self._word_key(word, context, source_lang, target_lang))
+        self._count(raw is not None)
         if raw is None:
             return None
         return CachedTranslation(**json.loads(raw))
@@ -64,7 +93,7 @@ class TranslationCache:
         r = get_redis()
         word_count = len(r.keys("word:*"))
         ctx_count = len(r.keys("ctx:*"))
-        return {"words": word_count, "contexts": ctx_count}
+        return {"words": word_count, "contexts": ctx_count, "hits": self.hits, "misses": self.misses}
 
     def clear(self) -> None:
         r = get_redis()
@@ -1,4 +1,8 @@
-from languages.base import LanguageConfig, LanguageModule, LanguageAnalysis, describe_morphology
+import importlib
+from types import MappingProxyType
+from typing import Mapping
+
+from languages.base import LanguageConfig, LanguageModule, LanguageAnalysis, describe_morphology, make_morph_describer
 
 # German module: pick v1 or v2 based on the GERMAN_V2_ENABLED env flag.
 # Both modules share the same dict_store and detector functions.
@@ -8,23 +12,32 @@ try:
 except Exception:
     _german_v2 = False
 
-if _german_v2:
-    from languages.german_v2 import German
-else:
-    from languages.german import German
 
+# Registry of all supported languages: code -> (module path, class name, spaCy model).
+# Modules are imported and instantiated on first get_language(code), so listing
+# models or importing this package doesn't pull in every language's detectors.
+_LANG_SPECS: Mapping[str, tuple[str, str, str]] = MappingProxyType({
+    "de": ("languages.german_v2" if _german_v2 else "languages.german", "German", "de_core_news_lg"),
+    # "fr": ("languages.french", "French", "fr_core_news_sm"),
+    # "en": ("languages.english", "English", "en_core_web_sm"),
+})
+
+_INSTANCES: dict[str, LanguageModule] = {}
+
+_SPACY_MODELS: Mapping[str, str] = MappingProxyType({code: spec[2] for code, spec in _LANG_SPECS.items()})
 
-# Registry of all supported languages
-_LANGUAGES: dict[str, LanguageModule] = {
-    "de": German(),
-    # "fr": French(),
-    # "en": English(),
-}
+
+def _language_class(code: str) -> type[LanguageModule]:
+    module_path, class_name, _ = _LANG_SPECS[code]
+    return getattr(importlib.import_module(module_path), class_name)
 
 
 def get_language(code: str) -> LanguageModule | None:
     """Get language module by ISO 639-1 code."""
-    return _LANGUAGES.get(code)
+    inst = _INSTANCES.get(code)
+    if inst is None and code in _LANG_SPECS:
+        inst = _INSTANCES[code] = _language_class(code)()
+    return inst
 
 
 def get_config(code: str) -> LanguageConfig | None:
@@ -33,14 +46,22 @@ def get_config(code: str) -> LanguageConfig | None:
     return lang.config if lang else None
 
 
-def get_spacy_models() -> dict[str, str]:
-    """Get mapping of language codes to spaCy model names."""
-    return {code: lang.config.spacy_model for code, lang in _LANGUAGES.items()}
+def get_spacy_models() -> Mapping[str, str]:
+    """Get read-only mapping of language codes to spaCy model names."""
+    return _SPACY_MODELS
 
 
 def supported_languages() -> list[str]:
     """Get list of supported language codes."""
-    return list(_LANGUAGES.keys())
+    return list(_LANG_SPECS.keys())
+
+
+def __getattr__(name: str):
+    # Lazy `from languages import German` (PEP 562)
+    for code, (_, class_name, _) in _LANG_SPECS.items():
+        if class_name == name:
+            return _language_class(code)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -48,6 +69,7 @@ __all__ = [
     "LanguageModule",
     "LanguageAnalysis",
     "describe_morphology",
+    "make_morph_describer",
     "get_language",
     "get_config",
     "get_spacy_models",
@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Callable
 
 from models import TokenRef
 
 
 # Universal morphology labels (based on Universal Dependencies)
-UNIVERSAL_MORPH_LABELS = {
+UNIVERSAL_MORPH_LABELS = MappingProxyType({
     # Tense
     "Tense=Past": "past tense",
     "Tense=Pres": "present tense",
@@ -54,7 +56,20 @@ UNIVERSAL_MORPH_LABELS = {
     "Degree=Pos": "positive",
     "Degree=Cmp": "comparative",
     "Degree=Sup": "superlative",
-}
+})
+
+# Same labels nested as {feature: {value: label}}, so lookups don't have to
+# format a "Key=Value" string per feature
+_LABELS_BY_KEY: dict[str, dict[str, str]] = {}
+for _label, _desc in UNIVERSAL_MORPH_LABELS.items():
+    _key, _, _value = _label.partition("=")
+    _LABELS_BY_KEY.setdefault(_key, {})[_value] = _desc
+del _label, _desc, _key, _value
+_NO_LABELS: dict[str, str] = {}
+_NO_TOKENS: tuple[int, ...] = ()
+
+# Separator for lowered_tokens() streams; never part of a spaCy token
+TOKEN_SEP = "\x1f"
 
 
 def describe_morphology(morph_dict: dict[str, str], include: list[str] | None = None) -> str:
@@ -69,18 +84,108 @@ def describe_morphology(morph_dict: dict[str, str], include: list[str] | None =
     Returns:
         Human-readable description like "present tense, 3rd person, singular"
     """
-    descriptions = []
+    # Output follows the order of `include` when given, else the morph's order
+    keys = include if include else morph_dict.keys()
+    return ", ".join(
+        desc
+        for key in keys
+        if (desc := _LABELS_BY_KEY.get(key, _NO_LABELS).get(morph_dict.get(key))) is not None
+    )
+
+
+def make_morph_describer(include: list[str]) -> Callable[[dict[str, str]], str]:
+    """
+    Build a describe_morphology(morph_dict, include) equivalent for a fixed
+    feature list, with the label tables for `include` resolved up front.
+
+    Meant for module-level use where the same include list is applied to
+    every token. Only a few value combinations exist per list, so rendered
+    descriptions are memoized on the tuple of included values.
+    """
+    tables = tuple((key, _LABELS_BY_KEY[key]) for key in include if key in _LABELS_BY_KEY)
+    keys = tuple(key for key, _ in tables)
+
+    @lru_cache(maxsize=256)
+    def render(values: tuple) -> str:
+        return ", ".join(
+            desc for (_, labels), value in zip(tables, values)
+            if (desc := labels.get(value)) is not None
+        )
+
+    def describe(morph_dict: dict[str, str]) -> str:
+        return render(tuple(map(morph_dict.get, keys)))
+
+    return describe
+
+
+def token_index(doc) -> tuple[dict[str, int], dict[int, int]]:
+    """(first token index per lowercased text, token index per char offset) for a Doc.
+
+    Built once and kept in doc.user_data, so the analyzer and language modules
+    looking up several tokens in the same context don't rescan it. Holds
+    indices, not Tokens: a Token references its Doc, so caching Tokens in
+    user_data would put every Doc in a reference cycle. Use doc[i].
+    """
+    index = doc.user_data.get("_token_index")
+    if index is None:
+        by_text = {}
+        for t in reversed(doc):
+            by_text[t.lower_] = t.i  # reversed: first occurrence wins
+        index = (by_text, {t.idx: t.i for t in doc})
+        doc.user_data["_token_index"] = index
+    return index
+
+
+def lowered_tokens(doc) -> tuple[list[str], str, dict[int, int]]:
+    """Lowercased token texts of a Doc, plus the same texts as one searchable string.
+
+    Returns (texts, stream, token_at): `stream` is TOKEN_SEP + the texts
+    joined by TOKEN_SEP + TOKEN_SEP, and token_at maps the offset of the
+    separator before each token to that token's index. A token sequence
+    then matches where stream.find() finds it joined and wrapped the same
+    way, so str.find does the scanning. Cached in doc.user_data like
+    token_index.
+    """
+    lowered = doc.user_data.get("_lowered_tokens")
+    if lowered is None:
+        texts = [t.lower_ for t in doc]
+        token_at: dict[int, int] = {}
+        offset = 0
+        for i, text in enumerate(texts):
+            token_at[offset] = i
+            offset += len(text) + 1
+        stream = TOKEN_SEP + TOKEN_SEP.join(texts) + TOKEN_SEP
+        lowered = doc.user_data["_lowered_tokens"] = (texts, stream, token_at)
+    return lowered
+
+
+def lowered_lemmas(doc) -> list[str]:
+    """Lowercased lemma per token index, computed once and cached in doc.user_data.
+
+    Dictionary lookups key on lowercased lemmas; detectors that pair every
+    verb with every preposition would otherwise re-lowercase them per pair.
+    """
+    lemmas = doc.user_data.get("_lowered_lemmas")
+    if lemmas is None:
+        lemmas = doc.user_data["_lowered_lemmas"] = [t.lemma_.lower() for t in doc]
+    return lemmas
 
-    keys = include if include else list(morph_dict.keys())
-    for key in keys:
-        value = morph_dict.get(key)
-        if value is None:
-            continue
-        label = f"{key}={value}"
-        if label in UNIVERSAL_MORPH_LABELS:
-            descriptions.append(UNIVERSAL_MORPH_LABELS[label])
 
-    return ", ".join(descriptions) if descriptions else ""
+def pos_tokens(doc, pos: str) -> list:
+    """Tokens with the given coarse POS tag, in document order.
+
+    The POS index is built in one pass and cached in doc.user_data, so
+    detectors asking for the verbs/nouns/prepositions of the same context
+    don't each rescan it. The cache holds token indices (see token_index)
+    and each call returns a fresh list of Tokens.
+    """
+    by_pos = doc.user_data.get("_pos_tokens")
+    if by_pos is None:
+        by_pos = {}
+        for t in doc:
+            by_pos.setdefault(t.pos_, []).append(t.i)
+        doc.user_data["_pos_tokens"] = by_pos
+    return [doc[i] for i in by_pos.get(pos, _NO_TOKENS)]
 
 
 @dataclass
@@ -97,7 +202,7 @@ class LanguageAnalysis:
     breakdown_fn: Callable | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LanguageConfig:
     """Configuration for a specific language."""
 
@@ -109,12 +214,20 @@ class LanguageConfig:
 class LanguageModule(ABC):
     """Abstract base class for language modules."""
 
+    # Optional spaCy components (parser, ner, senter) this module's analyze() reads.
+    # Everything not listed here is excluded when the model is loaded.
+    required_components: tuple[str, ...] = ()
+
     @property
     @abstractmethod
     def config(self) -> LanguageConfig:
         """Return the language configuration."""
         pass
 
+    def warm_up(self) -> None:
+        """Load lazily-initialized resources at startup. Override if needed."""
+        pass
+
     def classify_noun(self, token, morph: dict[str, str]) -> str:
         """Classify a noun. Override for language-specific logic."""
         if morph.get("Number") == "Plur":
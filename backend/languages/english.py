@@ -1,12 +1,14 @@
 """English language configuration."""
 
+import functools
+
 from languages.base import LanguageConfig, LanguageModule
 
 
 class English(LanguageModule):
     """English language support."""
 
-    @property
+    @functools.cached_property
     def config(self) -> LanguageConfig:
         return LanguageConfig(
             code="en",
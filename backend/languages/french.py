@@ -1,12 +1,14 @@
 """French language configuration."""
 
+import functools
+
 from languages.base import LanguageConfig, LanguageModule
 
 
 class French(LanguageModule):
     """French language support."""
 
-    @property
+    @functools.cached_property
     def config(self) -> LanguageConfig:
         return LanguageConfig(
             code="fr",
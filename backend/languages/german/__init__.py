@@ -1,18 +1,30 @@
 """German language module."""
 
+import functools
+
+import simplemma
 from models import TokenRef
-from languages.base import LanguageConfig, LanguageModule, LanguageAnalysis, describe_morphology
+from languages.base import LanguageConfig, LanguageModule, LanguageAnalysis, make_morph_describer, token_index
 from languages.german.compounds import split_compound
 from languages.german.verbs import detect_separable_verb, detect_separable_verb_from_prefix, detect_compound_tense, CompoundTenseInfo, detect_modal_verb, ModalVerbInfo, detect_lassen_construction, LassenInfo
 from languages.german.collocations import CollocationInfo, detect_verb_preposition_collocation
 from languages.german.expressions import FixedExpressionInfo, detect_fixed_expression
 from languages.german.nomen_verbs import NomenVerbInfo, detect_nomen_verb
 
+_describe_verb_morph = make_morph_describer(["Tense", "Person", "Number", "Mood"])
+_describe_person_number = make_morph_describer(["Person", "Number"])
+
+# Present participle endings, longest first so the first match is the full ending
+_PARTICIPLE_ENDINGS = ("enden", "ender", "endem", "endes", "ende", "end")
+
 
 class German(LanguageModule):
     """German language support."""
 
-    @property
+    # Detectors walk the dependency tree (token.head, dep_, sent)
+    required_components = ("parser",)
+
+    @functools.cached_property
     def config(self) -> LanguageConfig:
         return LanguageConfig(
             code="de",
@@ -20,24 +32,22 @@ class German(LanguageModule):
             spacy_model="de_core_news_lg",
         )
 
+    def warm_up(self) -> None:
+        # compound_split's n-gram tables and simplemma's German dictionary load
+        # on first use (~2s together); a throwaway split pulls in both
+        split_compound("Krankenhaus")
+
     def split_compound(self, word: str, lemma: str | None = None) -> list[str] | None:
         """Split a compound word into parts."""
         if lemma and lemma.endswith("end"):
             parts = split_compound(word)
             if not parts or len(parts) < 2:
                 return None
-            # Check if the last part looks like a valid participle (ends in -end/-ende/-enden/etc)
+            # The last part must look like a valid participle (ends in -end/-ende/-enden/etc)
+            # whose verb stem (part minus the longest ending) is long enough to be a real verb
             last_part = parts[-1].lower()
-            if not any(last_part.endswith(e) for e in ("end", "ende", "enden", "ender", "endem", "endes")):
-                return None
-            # Check the verb stem (part minus ending) is long enough to be a real verb
-            for ending in ("enden", "ender", "endem", "endes", "ende", "end"):
-                if last_part.endswith(ending):
-                    stem_len = len(last_part) - len(ending)
-                    break
-            else:
-                stem_len = len(last_part)
-            if stem_len < 3:
+            ending = next((e for e in _PARTICIPLE_ENDINGS if last_part.endswith(e)), None)
+            if ending is None or len(last_part) - len(ending) < 3:
                 return None
             return parts
         return split_compound(word)
@@ -95,11 +105,10 @@ class German(LanguageModule):
         """Build LanguageAnalysis for a fixed expression."""
         expr_text = expr.expression
         expr_related = expr.related
-        selected_text = word
+        # Everything but the translation is known now; the closure only formats
+        parts_display = " + ".join([word] + [r.text for r in expr_related])
 
         def breakdown_fn(analysis, base_translation, extra_translations=None):
-            all_parts = [selected_text] + [r.text for r in expr_related]
-            parts_display = " + ".join(all_parts)
             return f"{expr_text} ({base_translation}) → {parts_display}"
 
         return LanguageAnalysis(
@@ -125,17 +134,12 @@ class German(LanguageModule):
 
         # Capture data for breakdown closure
         col_pattern = collocation.pattern
-        col_related = collocation.related
-        selected_text = word
+        conjugated = " + ".join([word] + [r.text for r in collocation.related])
+        morph_desc = _describe_verb_morph(morph) if is_verb else ""
+        if morph_desc:
+            conjugated = f"{conjugated} ({morph_desc})"
 
         def breakdown_fn(analysis, base_translation, extra_translations=None):
-            all_parts = [selected_text] + [r.text for r in col_related]
-            conjugated = " + ".join(all_parts)
-            morph_desc = ""
-            if word_type == "collocation_verb":
-                morph_desc = describe_morphology(morph, include=["Tense", "Person", "Number", "Mood"])
-            if morph_desc:
-                return f"{col_pattern} ({base_translation}) → {conjugated} ({morph_desc})"
             return f"{col_pattern} ({base_translation}) → {conjugated}"
 
         return LanguageAnalysis(
@@ -152,15 +156,13 @@ class German(LanguageModule):
         self, word: str, token, infinitive: str, prefix_ref: TokenRef, morph: dict[str, str]
     ) -> LanguageAnalysis:
         """Build LanguageAnalysis when user selected the verb stem of a separable verb."""
-        selected_text = word.lower()
-        prefix_text = prefix_ref.text.lower()
         infinitive_l = infinitive.lower()
+        conjugated = f"{word.lower()} + {prefix_ref.text.lower()}"
+        morph_desc = _describe_verb_morph(morph)
+        if morph_desc:
+            conjugated = f"{conjugated} ({morph_desc})"
 
         def breakdown_fn(analysis, base_translation, extra_translations=None):
-            conjugated = f"{selected_text} + {prefix_text}"
-            morph_desc = describe_morphology(morph, include=["Tense", "Person", "Number", "Mood"])
-            if morph_desc:
-                return f"{infinitive_l} ({base_translation}) → {conjugated} ({morph_desc})"
             return f"{infinitive_l} ({base_translation}) → {conjugated}"
 
         return LanguageAnalysis(
@@ -175,15 +177,13 @@ class German(LanguageModule):
         self, word: str, infinitive: str, verb_text: str, verb_morph: dict[str, str], verb_offset: int
     ) -> LanguageAnalysis:
         """Build LanguageAnalysis when user selected the prefix/particle of a separable verb."""
-        selected_text = word.lower()
-        verb_text_l = verb_text.lower()
         infinitive_l = infinitive.lower()
+        conjugated = f"{verb_text.lower()} + {word.lower()}"
+        morph_desc = _describe_verb_morph(verb_morph)
+        if morph_desc:
+            conjugated = f"{conjugated} ({morph_desc})"
 
         def breakdown_fn(analysis, base_translation, extra_translations=None):
-            conjugated = f"{verb_text_l} + {selected_text}"
-            morph_desc = describe_morphology(verb_morph, include=["Tense", "Person", "Number", "Mood"])
-            if morph_desc:
-                return f"{infinitive_l} ({base_translation}) → {conjugated} ({morph_desc})"
             return f"{infinitive_l} ({base_translation}) → {conjugated}"
 
         return LanguageAnalysis(
@@ -197,30 +197,29 @@ class German(LanguageModule):
     def _analyze_lassen(self, word: str, info: LassenInfo, doc=None) -> LanguageAnalysis:
         canonical = f"sich {info.verb_infinitive} lassen" if info.has_sich else f"{info.verb_infinitive} lassen"
         selected_text = word
+        word_l = word.lower()
 
         related = []
-        if info.lassen_token_text.lower() != word.lower():
+        if info.lassen_token_text.lower() != word_l:
             related.append(TokenRef(info.lassen_token_text, info.lassen_token_idx))
-        if info.verb_token_text.lower() != word.lower():
+        if info.verb_token_text.lower() != word_l:
             related.append(TokenRef(info.verb_token_text, info.verb_token_idx))
-        if info.has_sich and info.sich_token_text and info.sich_token_text.lower() != word.lower():
+        if info.has_sich and info.sich_token_text and info.sich_token_text.lower() != word_l:
             related.append(TokenRef(info.sich_token_text, info.sich_token_idx))
 
         if doc is not None:
-            lassen_token = next((t for t in doc if t.idx == info.lassen_token_idx), None)
-            if lassen_token:
-                modal_info = detect_modal_verb(lassen_token, doc)
-                if modal_info and modal_info.modal_text.lower() != word.lower():
+            lassen_i = token_index(doc)[1].get(info.lassen_token_idx)
+            if lassen_i is not None:
+                modal_info = detect_modal_verb(doc[lassen_i], doc)
+                if modal_info and modal_info.modal_text.lower() != word_l:
                     related.append(TokenRef(modal_info.modal_text, modal_info.modal_idx))
 
-        lassen_morph = info.lassen_morph
+        conjugated = " + ".join([selected_text] + [r.text for r in related])
+        morph_desc = _describe_verb_morph(info.lassen_morph)
+        if morph_desc:
+            conjugated = f"{conjugated} ({morph_desc})"
 
         def breakdown_fn(analysis, base_translation, extra_translations=None):
-            all_parts = [selected_text] + [r.text for r in related]
-            conjugated = " + ".join(all_parts)
-            morph_desc = describe_morphology(lassen_morph, include=["Tense", "Person", "Number", "Mood"])
-            if morph_desc:
-                return f"{canonical} ({base_translation}) → {conjugated} ({morph_desc})"
             return f"{canonical} ({base_translation}) → {conjugated}"
 
         return LanguageAnalysis(
@@ -237,23 +236,19 @@ class German(LanguageModule):
         self, word: str, token, info: CompoundTenseInfo, morph: dict[str, str]
     ) -> LanguageAnalysis:
         """Build LanguageAnalysis for a verb in a compound tense (Perfekt, Futur, etc.)."""
-        import simplemma
         lemma = token.lemma_
         if lemma.lower() == token.text.lower():
             lemma = simplemma.lemmatize(token.text, lang="de")
-        selected_text = word
         aux_text = info.aux_text
-        aux_lemma = info.aux_lemma
-        aux_morph = info.aux_morph
-        tense = info.tense
+        verb_display = f"{aux_text.lower()} + {lemma.lower()}"
+        parts = [info.tense.split(" (")[0]]
+        person_number = _describe_person_number(info.aux_morph)
+        if person_number:
+            parts.append(person_number)
+        tense_display = ", ".join(parts)
 
         def breakdown_fn(analysis, base_translation, extra_translations=None):
-            tense_short = tense.split(" (")[0]
-            person_number = describe_morphology(aux_morph, include=["Person", "Number"])
-            parts = [tense_short]
-            if person_number:
-                parts.append(person_number)
-            return f"{aux_text.lower()} + {lemma.lower()} ({base_translation}) ({', '.join(parts)})"
+            return f"{verb_display} ({base_translation}) ({tense_display})"
 
         return LanguageAnalysis(
             word_type="conjugated_verb",
@@ -274,26 +269,20 @@ class German(LanguageModule):
             related = [TokenRef(info.verb_text, info.verb_idx)]
             translate_word = info.verb_lemma
 
+        word_l = word.lower()
         for text, idx in (info.cluster or []):
-            if text.lower() != word.lower():
+            if text.lower() != word_l:
                 related.append(TokenRef(text, idx))
 
-        modal_morph = info.modal_morph
-
-        modal_text = info.modal_text
-        verb_lemma = info.verb_lemma
+        modal_l = info.modal_text.lower()
+        verb_l = info.verb_lemma.lower()
+        morph_desc = _describe_verb_morph(info.modal_morph)
+        morph_suffix = f" ({morph_desc})" if morph_desc else ""
 
         def breakdown_fn(analysis, base_translation, extra_translations=None):
             modal_trans = (extra_translations or {}).get("modal_translation", "")
-            morph_desc = describe_morphology(modal_morph, include=["Tense", "Person", "Number", "Mood"])
-            modal_l = modal_text.lower()
-            verb_l = verb_lemma.lower()
             modal_part = f"{modal_l} ({modal_trans})" if modal_trans else modal_l
-            verb_part = f"{verb_l} ({base_translation})"
-            result = f"{modal_part} + {verb_part}"
-            if morph_desc:
-                result += f" ({morph_desc})"
-            return result
+            return f"{modal_part} + {verb_l} ({base_translation}){morph_suffix}"
 
         return LanguageAnalysis(
             translate=translate_word,
@@ -1,14 +1,18 @@
 """German verb+preposition collocation detection."""
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-import spacy
 from models import TokenRef
+from languages.base import pos_tokens
 from languages.german.dict_store import VERB_PREPOSITION_COLLOCATIONS
 from languages.german.verbs import REFLEXIVE_PRONOUNS
 
+if TYPE_CHECKING:
+    import spacy
 
-@dataclass
+
+@dataclass(slots=True)
 class CollocationInfo:
     """Internal: verb+preposition collocation info."""
     verb: str
@@ -16,14 +20,31 @@ class CollocationInfo:
     related: list[TokenRef]
 
 
-def _find_reflexive(doc: spacy.tokens.Doc):
+def _find_reflexive(doc: "spacy.tokens.Doc"):
     """Return the reflexive pronoun token (sich/mich/dich/uns/euch) if present, else None."""
     for t in doc:
-        if t.text.lower() in REFLEXIVE_PRONOUNS:
+        if t.lower_ in REFLEXIVE_PRONOUNS:
             return t
     return None
 
 
+def _particles_by_head(doc) -> dict[int, int]:
+    """Index of the first separable particle (PTKVZ) attached to each head token, by head index.
+
+    Cached in doc.user_data: the prefix lookup runs for every collocation
+    check against the same context. Holds indices rather than Tokens, which
+    would tie the Doc into a reference cycle; read particles with doc[i].
+    """
+    particles = doc.user_data.get("_de_ptkvz_by_head")
+    if particles is None:
+        particles = {}
+        for t in doc:
+            if t.tag_ == "PTKVZ" and t.head.i != t.i:
+                particles.setdefault(t.head.i, t.i)
+        doc.user_data["_de_ptkvz_by_head"] = particles
+    return particles
+
+
 def _is_reflexive_pronoun(word: str) -> bool:
     """Check if a word is a German reflexive pronoun."""
     return word.lower() in REFLEXIVE_PRONOUNS
@@ -31,14 +52,14 @@ def _is_reflexive_pronoun(word: str) -> bool:
 
 def _find_collocation(target, verb_token, prep_token, doc):
     """Check if verb+prep is a known collocation and return CollocationInfo."""
-    prefix = next((t for t in doc if t.head == verb_token and t.tag_ == "PTKVZ"), None)
+    prefix_i = _particles_by_head(doc).get(verb_token.i)
+    prefix = doc[prefix_i] if prefix_i is not None else None
     full_lemma = (prefix.text.lower() + verb_token.lemma_) if prefix else verb_token.lemma_
     prep = prep_token.text.lower()
 
     for lemma in (full_lemma, verb_token.lemma_):
-        if (lemma, prep) in VERB_PREPOSITION_COLLOCATIONS:
-            pattern = VERB_PREPOSITION_COLLOCATIONS[(lemma, prep)]
-
+        pattern = VERB_PREPOSITION_COLLOCATIONS.get((lemma, prep))
+        if pattern is not None:
             # Collect related tokens (all parts except the selected word)
             parts = [verb_token, prep_token, prefix]
 
@@ -70,14 +91,14 @@ _DA_PREPS = {
 def _extract_da_prep(doc):
     """Return the preposition string hidden in a da+prep token, or None."""
     for t in doc:
-        prep = _DA_PREPS.get(t.text.lower())
+        prep = _DA_PREPS.get(t.lower_)
         if prep:
             return prep
     return None
 
 
 def detect_verb_preposition_collocation(
-    target, doc: spacy.tokens.Doc
+    target, doc: "spacy.tokens.Doc"
 ) -> CollocationInfo | None:
     """Detect verb+preposition collocations from context.
 
@@ -89,11 +110,11 @@ def detect_verb_preposition_collocation(
     verb_token, prep_token = None, None
     if target.tag_ == "PTKVZ" and target.head.pos_ == "VERB":
         verb_token = target.head
-        prep_token = next((t for t in doc if t.pos_ == "ADP" and t.tag_ != "PTKVZ"), None)
+        prep_token = next((t for t in pos_tokens(doc, "ADP") if t.tag_ != "PTKVZ"), None)
     elif target.pos_ == "VERB":
         verb_token = target
         prep_token = next(
-            (t for t in doc if t.pos_ == "ADP" and t.tag_ != "PTKVZ" and t.head == verb_token),
+            (t for t in pos_tokens(doc, "ADP") if t.tag_ != "PTKVZ" and t.head == verb_token),
             None,
         )
         if prep_token is None and target.tag_ == "VVFIN":
@@ -102,21 +123,22 @@ def detect_verb_preposition_collocation(
                 # Synthesize a fake prep string for lookup only
                 verb_token = target
                 # Use _find_collocation directly with the extracted prep string
-                prefix = next((t for t in doc if t.head == verb_token and t.tag_ == "PTKVZ"), None)
+                prefix_i = _particles_by_head(doc).get(verb_token.i)
+                prefix = doc[prefix_i] if prefix_i is not None else None
                 full_lemma = (prefix.text.lower() + verb_token.lemma_) if prefix else verb_token.lemma_
                 for lemma in (full_lemma, verb_token.lemma_):
-                    if (lemma, da_prep) in VERB_PREPOSITION_COLLOCATIONS:
-                        pattern = VERB_PREPOSITION_COLLOCATIONS[(lemma, da_prep)]
+                    pattern = VERB_PREPOSITION_COLLOCATIONS.get((lemma, da_prep))
+                    if pattern is not None:
                         related = [TokenRef(t.text, t.idx) for t in [prefix] if t and t != target]
                         return CollocationInfo(lemma, pattern, related)
                 return None
     elif target.pos_ == "ADP":
         prep_token = target
-        verb_token = next((t for t in doc if t.pos_ == "VERB"), None)
+        verb_token = next(iter(pos_tokens(doc, "VERB")), None)
     elif _is_reflexive_pronoun(target.text.lower()):
         # User selected a reflexive pronoun (sich/mich/dich/uns/euch) — find verb and preposition
-        verb_token = next((t for t in doc if t.pos_ == "VERB"), None)
-        prep_token = next((t for t in doc if t.pos_ == "ADP" and t.tag_ != "PTKVZ"), None)
+        verb_token = next(iter(pos_tokens(doc, "VERB")), None)
+        prep_token = next((t for t in pos_tokens(doc, "ADP") if t.tag_ != "PTKVZ"), None)
 
     if verb_token and prep_token:
         return _find_collocation(target, verb_token, prep_token, doc)
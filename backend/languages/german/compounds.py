@@ -1,7 +1,15 @@
 """German compound word splitting."""
 
+from functools import lru_cache
+
 import simplemma
 
+try:
+    from compound_split import char_split as _char_split
+    _char_split_fn = _char_split.split_compound
+except ImportError:
+    _char_split_fn = None
+
 # Derivational suffixes - words ending in these are derived from verbs/adjectives
 DERIVATIONAL_SUFFIXES = ("ung", "heit", "keit", "schaft", "nis", "tum", "ling", "atz")
 
@@ -9,7 +17,7 @@ DERIVATIONAL_SUFFIXES = ("ung", "heit", "keit", "schaft", "nis", "tum", "ling",
 VERB_STEM_NOUNS = frozenset({
     "fall", "gang", "griff", "zug", "schlag", "bruch", "schnitt", "schluss",
     "tritt", "wurf", "ruf", "lauf", "stoß", "druck", "blick", "sprung",
-    "schied", "halt", "stand", "satz", "trieb", "schlug", "stieg", "schnitt",
+    "schied", "halt", "stand", "satz", "trieb", "schlug", "stieg",
 })
 
 # Verb prefixes - when combined with derivational suffix = derived word, not compound
@@ -24,6 +32,14 @@ VERB_PREFIXES = frozenset({
     "unter", "über", "durch", "wider", "hinter", "wieder",
 })
 
+# Function words that CharSplit sometimes proposes as a compound part
+_FUNCTION_WORDS = frozenset({
+    "aus", "ein", "auf", "vor", "mit", "bei", "nach", "von",
+    "für", "über", "unter", "bis", "durch", "ohne", "gegen",
+    "der", "die", "das", "den", "dem", "des",
+    "und", "oder", "aber", "als", "wie", "wenn", "weil",
+})
+
 # Linking elements in compounds (Fugenelement)
 LINKING_PATTERNS = [
     ("ungs", "ung"),        # Verhandlungs -> Verhandlung
@@ -38,36 +54,58 @@ LINKING_PATTERNS = [
     ("es", ""),             # Kindes -> Kind
 ]
 
+# LINKING_PATTERNS grouped by their last two characters, so a lookup only
+# tries the few links that can match the word's ending
+_LINKS_BY_TAIL: dict[str, tuple[str, ...]] = {}
+for _link, _ in LINKING_PATTERNS:
+    _LINKS_BY_TAIL[_link[-2:]] = _LINKS_BY_TAIL.get(_link[-2:], ()) + (_link,)
+
+# Fugen-s suffixes stripped by _clean_compound_part (ens, ns, es, s, in that
+# order), keyed by the part's last two letters so only reachable ones are tried
+_FUGEN_S_BY_TAIL: dict[str, tuple[str, ...]] = {"ns": ("ens", "ns", "s"), "es": ("es", "s")}
+
 # Fugenlaute (linking sounds) - the "s" is the most common
 # Used to prefer splits at Fugenlaut boundaries when scores are close
 FUGENLAUTE = ("s", "n", "en", "er", "es", "ens", "ns")
 
 
-def _is_derived_word(word: str, parts: list[str]) -> bool:
-    """Check if a word is derived (not a true compound) based on split parts."""
+def _is_derived_word(word: str, parts: list[str], word_lower: str | None = None) -> bool:
+    """Check if a word is derived (not a true compound) based on split parts.
+
+    Callers that already lowercased the word can pass it as word_lower.
+    """
     if len(parts) != 2:
         return False
 
-    first_part = parts[0].lower()
     second_part = parts[1].lower()
-    word_lower = word.lower()
 
     if second_part in DERIVATIONAL_SUFFIXES:
         return True
 
-    if any(word_lower.endswith(suffix) for suffix in DERIVATIONAL_SUFFIXES):
-        if first_part in VERB_PREFIXES:
-            return True
+    # Every remaining rule needs a verb-prefix first part; look it up once
+    if parts[0].lower() not in VERB_PREFIXES:
+        return False
 
-    if word_lower.endswith("en") and first_part in VERB_PREFIXES and second_part.endswith("en"):
-        return True
+    if word_lower is None:
+        word_lower = word.lower()
+    return (
+        word_lower.endswith(DERIVATIONAL_SUFFIXES)
+        or (word_lower.endswith("en") and second_part.endswith("en"))
+        or second_part in VERB_STEM_NOUNS
+    )
 
-    if first_part in VERB_PREFIXES and second_part in VERB_STEM_NOUNS:
-        return True
 
-    return False
+@lru_cache(maxsize=16384)
+def _is_known(word: str) -> bool:
+    """simplemma.is_known for German, memoized.
+
+    simplemma caches lemmatize() internally but not is_known(), and the
+    splitter asks about the same candidate parts over and over.
+    """
+    return simplemma.is_known(word, lang="de")
 
 
+@lru_cache(maxsize=8192)
 def _is_fugen_s(word: str) -> bool:
     """Check if trailing 's' in a word is a Fugen-s (linking sound), not part of the stem."""
     if len(word) < 5 or word[-1].lower() != "s" or word[-2:].lower() == "ss":
@@ -78,22 +116,28 @@ def _is_fugen_s(word: str) -> bool:
     lemma = simplemma.lemmatize(word, lang="de")
     if lemma.lower() != word.lower():
         return True
-    if not simplemma.is_known(word, lang="de") and simplemma.is_known(stripped, lang="de"):
+    if not _is_known(word) and _is_known(stripped):
         return True
     return False
 
 
+@lru_cache(maxsize=8192)
 def _has_fugenlaut(left: str) -> bool:
-    """Check if a compound left part ends with a Fugenlaut (linking sound)."""
+    """Check if a compound left part ends with a Fugenlaut (linking sound).
+
+    Cached: CharSplit proposes the same left parts for many words, and the
+    Fugen-s check behind this costs up to three simplemma lookups.
+    """
     left_lower = left.lower()
     # Check structured linking patterns first (more specific)
-    for link, base in LINKING_PATTERNS:
+    for link in _LINKS_BY_TAIL.get(left_lower[-2:], ()):
         if left_lower.endswith(link) and len(left) > len(link) + 2:
             return True
     # Check bare Fugen-s using word-level validation
     return _is_fugen_s(left)
 
 
+@lru_cache(maxsize=8192)
 def _clean_compound_part(part: str) -> str:
     """Remove linking elements from compound parts (Fugenelement).
 
@@ -102,21 +146,25 @@ def _clean_compound_part(part: str) -> str:
     2. Strip Fugenlaute (s/es/ns/ens) — for words simplemma doesn't know
     3. simplemma.lemmatize on stripped form
     """
+    part_lower = part.lower()
     # Layer 1: simplemma lemmatize
     sm_lemma = simplemma.lemmatize(part, lang="de")
-    if sm_lemma and sm_lemma.lower() != part.lower() and simplemma.is_known(sm_lemma, lang="de"):
+    if sm_lemma and sm_lemma.lower() != part_lower and _is_known(sm_lemma):
         return sm_lemma
     # If input is already a known word, return as-is
-    if simplemma.is_known(part, lang="de"):
+    if _is_known(part):
         return part
     # Layer 2+3: strip Fugenlaute then re-lemmatize
-    for suffix in ("ens", "ns", "es", "s"):
-        if part.lower().endswith(suffix) and len(part) > len(suffix) + 2:
+    if not part_lower.endswith("s"):
+        return part
+    for suffix in _FUGEN_S_BY_TAIL.get(part_lower[-2:], ("s",)):
+        if part_lower.endswith(suffix) and len(part) > len(suffix) + 2:
             stripped = part[:-len(suffix)]
             stripped_lemma = simplemma.lemmatize(stripped, lang="de")
-            if simplemma.is_known(stripped_lemma, lang="de"):
+            if _is_known(stripped_lemma):
                 return stripped_lemma
-            if simplemma.is_known(stripped, lang="de"):
+            # The stripped form is its own lemma: it was just checked
+            if stripped_lemma != stripped and _is_known(stripped):
                 return stripped
     return part
 
@@ -125,6 +173,7 @@ def _clean_compound_part(part: str) -> str:
 PARTICIPLE_ENDINGS = ("end", "ende", "enden", "ender", "endem", "endes")
 
 
+@lru_cache(maxsize=8192)
 def _split_once(word: str, min_score: float = 0.4, prefer_participle: bool = False) -> tuple[str, str] | None:
     """
     Split a word into exactly two parts using CharSplit.
@@ -137,50 +186,45 @@ def _split_once(word: str, min_score: float = 0.4, prefer_participle: bool = Fal
     Returns:
         Tuple of (left_part, right_part) or None if no good split
     """
-    try:
-        from compound_split import char_split
-    except ImportError:
+    if _char_split_fn is None:
+        return None
+
+    # Only letters and hyphens can form a compound (E-Mail-Adresse); skip
+    # CharSplit for tokens with digits, punctuation or underscores
+    if not word.replace("-", "").isalpha():
         return None
 
-    results = char_split.split_compound(word)
+    results = _char_split_fn(word)
     if not results:
         return None
 
-    # Filter to valid results above minimum score, rejecting function-word parts
-    _function_words = frozenset({
-        "aus", "ein", "auf", "vor", "mit", "bei", "nach", "von",
-        "für", "über", "unter", "bis", "durch", "ohne", "gegen",
-        "der", "die", "das", "den", "dem", "des",
-        "und", "oder", "aber", "als", "wie", "wenn", "weil",
-    })
-    valid_results = []
-    for r in results:
-        if not isinstance(r, tuple) or len(r) < 3:
-            continue
-        if r[0] < min_score:
-            continue
-        # Reject splits where either part is a short function word
-        if r[1].lower() in _function_words or r[2].lower() in _function_words:
-            continue
-        valid_results.append(r)
-
-    if not valid_results:
+    # Filter to valid results above minimum score, rejecting splits where
+    # either part is a short function word. CharSplit returns candidates
+    # best-first and usually only the first few are looked at, so filter lazily.
+    valid_results = (
+        r for r in results
+        if isinstance(r, tuple) and len(r) >= 3 and r[0] >= min_score
+        and r[1].lower() not in _FUNCTION_WORDS and r[2].lower() not in _FUNCTION_WORDS
+    )
+    best = next(valid_results, None)
+    if best is None:
         return None
 
     # If looking for participle split, prefer splits where right part is a valid participle
     # (ends in -end/-ende/etc. and has a verb stem of at least 4 chars)
     if prefer_participle:
-        for r in valid_results:
+        runners_up = list(valid_results)
+        for r in (best, *runners_up):
             right_lower = r[2].lower()
-            for ending in PARTICIPLE_ENDINGS:
-                if right_lower.endswith(ending) and len(r[2]) - len(ending) >= 4:
-                    return (r[1], r[2])
-
-    best = valid_results[0]
+            # Every ending starts with "end" and none contains it twice, so
+            # rfind locates the matched ending and its index is the stem length
+            if right_lower.endswith(PARTICIPLE_ENDINGS) and right_lower.rfind("end") >= 4:
+                return (r[1], r[2])
+        valid_results = iter(runners_up)
 
     # When the best split doesn't have a Fugenlaut but a close runner-up does, prefer it
-    if len(valid_results) > 1 and not _has_fugenlaut(best[1]):
-        for r in valid_results[1:]:
+    if not _has_fugenlaut(best[1]):
+        for r in valid_results:
             if best[0] - r[0] > 0.5:
                 break  # Too far from the best score
             if _has_fugenlaut(r[1]):
@@ -189,24 +233,65 @@ def _split_once(word: str, min_score: float = 0.4, prefer_participle: bool = Fal
     return (best[1], best[2])
 
 
-def split_compound(word: str, _depth: int = 0) -> list[str] | None:
+def split_compound(word: str) -> list[str] | None:
     """
     Split a German compound word into its parts recursively.
 
     Uses CharSplit for splitting. Recursively splits parts that are
     long enough to handle multi-part compounds like "Krankenversicherungssystem".
+    Results are cached per word; callers get a fresh list they may modify.
 
     Args:
         word: The word to split
-        _depth: Internal recursion depth counter
 
     Returns:
         List of parts or None if not a compound
     """
-    # Prevent infinite recursion
-    if _depth > 2:
+    parts = _split_compound_cached(word)
+    return list(parts) if parts else None
+
+
+@lru_cache(maxsize=8192)
+def _split_compound_cached(word: str) -> tuple[str, ...] | None:
+    parts = _split_compound(word)
+    return tuple(parts) if parts else None
+
+
+# Deepest level at which a left part is split again
+_MAX_DEPTH = 2
+
+
+def _split_compound(word: str) -> list[str] | None:
+    """Uncached worker for split_compound().
+
+    Peels the head off the word, then keeps splitting the cleaned left part
+    while it is long enough (>= 10 chars suggests it might be a compound)
+    and the depth limit allows. A left part that doesn't split further is
+    kept whole.
+    """
+    split = _split_head(word, 0)
+    if not split:
         return None
 
+    left, right = split
+    heads = [right]
+    depth = 1
+    while len(left) >= 10 and depth <= _MAX_DEPTH:
+        split = _split_head(left, depth)
+        if not split:
+            break
+        left, right = split
+        heads.append(right)
+        depth += 1
+
+    heads.append(left)
+    heads.reverse()
+    return heads
+
+
+def _split_head(word: str, depth: int) -> tuple[str, str] | None:
+    """Split a word once into (cleaned left part, head), or None if the split
+    isn't a plausible compound."""
     # Minimum word length to attempt splitting
     if len(word) < 6:
         return None
@@ -216,13 +301,14 @@ def split_compound(word: str, _depth: int = 0) -> list[str] | None:
         min_score = -1.0  # Long compounds
     elif len(word) >= 10:
         min_score = -1.0  # Medium compounds (lowered to catch participial adjectives)
-    elif _depth > 0:
+    elif depth > 0:
         min_score = 0.5   # Stricter for recursive splits
     else:
         min_score = 0.4   # Normal compounds
 
     # Check if word looks like a participial adjective (ends in -end/-ende/etc.)
-    prefer_participle = any(word.lower().endswith(e) for e in PARTICIPLE_ENDINGS)
+    word_lower = word.lower()
+    prefer_participle = word_lower.endswith(PARTICIPLE_ENDINGS)
 
     # Try to split the word
     split = _split_once(word, min_score, prefer_participle=prefer_participle)
@@ -236,34 +322,22 @@ def split_compound(word: str, _depth: int = 0) -> list[str] | None:
         return None
 
     # Check if it's a derived word (Ausbildung, not Aus + Bildung)
-    if _is_derived_word(word, [left, right]):
+    if _is_derived_word(word, [left, right], word_lower):
         return None
 
-    # Validate that both parts are recognizable words (reject gibberish splits)
+    # Validate that both parts are recognizable words (reject gibberish splits).
+    # The head is checked first: it's a single lookup, while cleaning the left
+    # part can take several lemmatizer calls, and most non-compounds fail here.
+    if not _is_known(right):
+        return None
     cleaned_left = _clean_compound_part(left)
     left_known = (
-        simplemma.is_known(cleaned_left, lang="de")
-        or simplemma.is_known(cleaned_left + "n", lang="de")
-        or simplemma.is_known(cleaned_left + "en", lang="de")
+        _is_known(cleaned_left)
+        or _is_known(cleaned_left + "n")
+        or _is_known(cleaned_left + "en")
     )
-    if not left_known or not simplemma.is_known(right, lang="de"):
+    if not left_known:
         return None
 
     # Clean linking elements from left part
-    left = cleaned_left
-
-    # Recursively split the left part if it's long enough (likely another compound)
-    # Only recurse if the part is substantial (>= 10 chars suggests it might be compound)
-    result = []
-    if len(left) >= 10:
-        left_parts = split_compound(left, _depth + 1)
-        if left_parts:
-            result.extend(left_parts)
-        else:
-            result.append(left)
-    else:
-        result.append(left)
-
-    result.append(right)
-
-    return result if len(result) > 1 else None
+    return cleaned_left, right
@@ -10,11 +10,11 @@ Public state (mutated in place by load()):
     NOMEN_VERB_PREP                  dict[(prep, noun, verb_lemma) -> canonical]
     NOMEN_VERB_REFLEXIVE             set[(noun, verb_lemma)]
     NOMEN_VERB_PREP_REFLEXIVE        dict[(prep, noun, verb_lemma) -> canonical]
-    NOMEN_VERB_INDEX                 dict[noun_lower -> list[(noun, verb_lemma)]]
-    NOMEN_VERB_PREP_INDEX            dict[noun_lower -> list[(prep, noun, verb)]]
-    NOMEN_VERB_PREP_REFLEXIVE_INDEX  dict[noun_lower -> list[(prep, noun, verb)]]
+    NOMEN_VERB_INDEX                 dict[noun_lower -> tuple[(noun, verb_lemma), ...]]
+    NOMEN_VERB_PREP_INDEX            dict[noun_lower -> tuple[(prep, noun, verb), ...]]
+    NOMEN_VERB_PREP_REFLEXIVE_INDEX  dict[noun_lower -> tuple[(prep, noun, verb), ...]]
     FIXED_EXPRESSIONS                dict[tuple[str, ...] -> canonical]
-    EXPRESSION_INDEX                 dict[word_lower -> list[tuple[str, ...]]]
+    EXPRESSION_INDEX                 dict[word_lower -> tuple[tuple[str, ...], ...]]
     FIGURATIVE_EXPRESSIONS           set[tuple[str, ...]]
     EXPRESSION_MEANINGS              dict[tuple[str, ...] -> {meaning_de, meaning_targets}]
     VERB_PREPOSITION_COLLOCATIONS    dict[(verb_lemma, prep) -> pattern]
@@ -24,7 +24,10 @@ import json
 import logging
 import os
 import sqlite3
+import sys
+from collections import defaultdict
 from pathlib import Path
+from typing import Iterable
 
 log = logging.getLogger(__name__)
 
@@ -35,12 +38,12 @@ NOMEN_VERB: dict[tuple[str, str], str] = {}
 NOMEN_VERB_PREP: dict[tuple[str, str, str], str] = {}
 NOMEN_VERB_REFLEXIVE: set[tuple[str, str]] = set()
 NOMEN_VERB_PREP_REFLEXIVE: dict[tuple[str, str, str], str] = {}
-NOMEN_VERB_INDEX: dict[str, list[tuple[str, str]]] = {}
-NOMEN_VERB_PREP_INDEX: dict[str, list[tuple[str, str, str]]] = {}
-NOMEN_VERB_PREP_REFLEXIVE_INDEX: dict[str, list[tuple[str, str, str]]] = {}
+NOMEN_VERB_INDEX: dict[str, tuple[tuple[str, str], ...]] = {}
+NOMEN_VERB_PREP_INDEX: dict[str, tuple[tuple[str, str, str], ...]] = {}
+NOMEN_VERB_PREP_REFLEXIVE_INDEX: dict[str, tuple[tuple[str, str, str], ...]] = {}
 
 FIXED_EXPRESSIONS: dict[tuple[str, ...], str] = {}
-EXPRESSION_INDEX: dict[str, list[tuple[str, ...]]] = {}
+EXPRESSION_INDEX: dict[str, tuple[tuple[str, ...], ...]] = {}
 
 # Tokens-key → metadata for figurative entries (idioms from Wiktionary).
 # Empty for plain fixed expressions. Used by the response layer to mark
@@ -70,24 +73,36 @@ GERMAN_NOUN_LEMMAS: set[str] = set()
 N_DECL_LEMMAS: set[str] = set()
 
 
-def _build_indexes() -> None:
-    """Rebuild the reverse indexes from the primary dicts."""
-    NOMEN_VERB_INDEX.clear()
-    for (noun, verb_lemma) in NOMEN_VERB:
-        NOMEN_VERB_INDEX.setdefault(noun.lower(), []).append((noun, verb_lemma))
+def _fill_index(index: dict, pairs: Iterable[tuple[str, tuple]]) -> None:
+    """Replace an index's contents with (key, entry) pairs grouped by key.
 
-    NOMEN_VERB_PREP_INDEX.clear()
-    for (prep, noun, verb_lemma) in NOMEN_VERB_PREP:
-        NOMEN_VERB_PREP_INDEX.setdefault(noun.lower(), []).append((prep, noun, verb_lemma))
+    Buckets are collected as lists and stored as tuples: the indexes are
+    read-only between loads, and tuples are smaller and quicker to scan.
+    The index is refilled in place since detectors import it by name.
+    """
+    grouped: defaultdict[str, list[tuple]] = defaultdict(list)
+    for key, entry in pairs:
+        grouped[key].append(entry)
+    index.clear()
+    index.update((key, tuple(bucket)) for key, bucket in grouped.items())
 
-    NOMEN_VERB_PREP_REFLEXIVE_INDEX.clear()
-    for (prep, noun, verb_lemma) in NOMEN_VERB_PREP_REFLEXIVE:
-        NOMEN_VERB_PREP_REFLEXIVE_INDEX.setdefault(noun.lower(), []).append((prep, noun, verb_lemma))
 
-    EXPRESSION_INDEX.clear()
-    for tokens in FIXED_EXPRESSIONS:
-        for word in tokens:
-            EXPRESSION_INDEX.setdefault(word.lower(), []).append(tokens)
+def _build_indexes() -> None:
+    """Rebuild the reverse indexes from the primary dicts."""
+    # Lowercase each distinct noun once; the three NVV indexes then share
+    # one interned key object per noun
+    nouns = {key[0] for key in NOMEN_VERB}
+    nouns.update(key[1] for key in NOMEN_VERB_PREP)
+    nouns.update(key[1] for key in NOMEN_VERB_PREP_REFLEXIVE)
+    noun_lower = {noun: sys.intern(noun.lower()) for noun in nouns}
+
+    _fill_index(NOMEN_VERB_INDEX, ((noun_lower[key[0]], key) for key in NOMEN_VERB))
+    _fill_index(NOMEN_VERB_PREP_INDEX, ((noun_lower[key[1]], key) for key in NOMEN_VERB_PREP))
+    _fill_index(NOMEN_VERB_PREP_REFLEXIVE_INDEX, ((noun_lower[key[1]], key) for key in NOMEN_VERB_PREP_REFLEXIVE))
+    _fill_index(
+        EXPRESSION_INDEX,
+        ((word.lower(), tokens) for tokens in FIXED_EXPRESSIONS for word in tokens),
+    )
 
 
 def _fetch_sqlite(path: Path) -> dict:
@@ -130,6 +145,16 @@ def _fetch_sqlite(path: Path) -> dict:
         conn.close()
 
 
+def _clear_split_caches() -> None:
+    """Drop memoized compound splits computed against the previous data."""
+    # Imported here: the v2 compounds module imports this one
+    from languages.german import compounds
+    from languages.german_v2 import compounds as v2_compounds
+
+    compounds._split_compound_cached.cache_clear()
+    v2_compounds._split_top_cached.cache_clear()
+
+
 def load() -> None:
     """Load the German dictionaries from SQLite into memory.
 
@@ -166,11 +191,15 @@ def load() -> None:
     NOMEN_VERB_REFLEXIVE.clear()
     NOMEN_VERB_PREP_REFLEXIVE.clear()
 
+    # The same nouns, verbs and prepositions recur across thousands of rows,
+    # and sqlite hands back a fresh str for each; intern them so every key
+    # tuple and index entry shares one object per word. Canonical forms are
+    # interned too: variant rows (Gedanke/Gedanken) share one canonical.
     for r in nvv_rows:
-        noun = r["noun"]
-        verb_lemma = r["verb_lemma"]
-        prep_lemma = r["prep_lemma"]
-        canonical = r["canonical"]
+        noun = sys.intern(r["noun"])
+        verb_lemma = sys.intern(r["verb_lemma"])
+        prep_lemma = r["prep_lemma"] and sys.intern(r["prep_lemma"])
+        canonical = sys.intern(r["canonical"])
         requires_sich = r["requires_sich"]
 
         if prep_lemma is None:
@@ -185,8 +214,10 @@ def load() -> None:
     FIXED_EXPRESSIONS.clear()
     FIGURATIVE_EXPRESSIONS.clear()
     EXPRESSION_MEANINGS.clear()
+    # Expression words (auf, die, sich, …) repeat across rows and overlap
+    # with the NVV and collocation vocabulary; intern them into one pool
     for r in expr_rows:
-        tokens = tuple(r["tokens"])
+        tokens = tuple(map(sys.intern, r["tokens"]))
         FIXED_EXPRESSIONS[tokens] = r["canonical"]
         if r.get("figurative"):
             FIGURATIVE_EXPRESSIONS.add(tokens)
@@ -200,7 +231,8 @@ def load() -> None:
 
     VERB_PREPOSITION_COLLOCATIONS.clear()
     for r in coll_rows:
-        VERB_PREPOSITION_COLLOCATIONS[(r["verb_lemma"], r["preposition"])] = r["pattern"]
+        key = (sys.intern(r["verb_lemma"]), sys.intern(r["preposition"]))
+        VERB_PREPOSITION_COLLOCATIONS[key] = r["pattern"]
 
     MODAL_PARTICLES.clear()
     for r in particle_rows:
@@ -219,6 +251,7 @@ def load() -> None:
             N_DECL_LEMMAS.add(lemma)
 
     _build_indexes()
+    _clear_split_caches()
 
     log.info(
         "Loaded German dicts from %s: %d NVV / %d NVV+prep / %d NVV+prep+sich / "
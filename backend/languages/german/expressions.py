@@ -1,13 +1,18 @@
 """German fixed expression detection (adverbial locutions + Nomen-Verb-Verbindungen)."""
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import spacy
 from models import TokenRef
+from languages.base import TOKEN_SEP, lowered_tokens
 from languages.german.dict_store import EXPRESSION_INDEX
 
+if TYPE_CHECKING:
+    import spacy
 
-@dataclass
+
+@dataclass(slots=True)
 class FixedExpressionInfo:
     """Detected fixed expression (e.g., "auf jeden Fall", "eine Frage stellen")."""
     expression: str         # canonical form: "auf jeden Fall"
@@ -15,7 +20,7 @@ class FixedExpressionInfo:
 
 
 def detect_fixed_expression(
-    target, doc: spacy.tokens.Doc
+    target, doc: "spacy.tokens.Doc"
 ) -> FixedExpressionInfo | None:
     """Detect fixed expressions from context.
 
@@ -32,53 +37,65 @@ def detect_fixed_expression(
     if not candidates:
         return None
 
-    # Build token list from doc (text + index)
-    doc_tokens = [(t.text, t.idx) for t in doc]
-    doc_lower = [t.text.lower() for t in doc]
+    _, stream, token_at = lowered_tokens(doc)
 
     best: FixedExpressionInfo | None = None
 
     for candidate in candidates:
-        match = _find_contiguous_match(candidate, doc_tokens, doc_lower, word_lower)
+        match = _find_contiguous_match(candidate, doc, stream, token_at, word_lower)
         if match and (best is None or len(candidate) > len(best.expression.split())):
             best = match
 
     return best
 
 
+@lru_cache(maxsize=4096)
+def _needle(candidate: tuple[str, ...]) -> str:
+    """Candidate expression in lowered_tokens() stream form."""
+    return TOKEN_SEP + TOKEN_SEP.join(w.lower() for w in candidate) + TOKEN_SEP
+
+
 def _find_contiguous_match(
     candidate: tuple[str, ...],
-    doc_tokens: list[tuple[str, int]],
-    doc_lower: list[str],
+    doc: "spacy.tokens.Doc",
+    stream: str,
+    token_at: dict[int, int],
     selected_word: str,
 ) -> FixedExpressionInfo | None:
     """Try to find a contiguous token sequence matching the candidate tuple.
 
+    Occurrences are located with str.find on the doc's lowered token stream
+    (see lowered_tokens), leftmost first; only matched spans are read back
+    from the doc.
+
     Returns FixedExpressionInfo if found and the selected word is part of it.
     """
-    candidate_lower = [w.lower() for w in candidate]
-    cand_len = len(candidate_lower)
-
-    for start in range(len(doc_lower) - cand_len + 1):
-        if doc_lower[start:start + cand_len] == candidate_lower:
-            # Found a match — check if selected word is in it
-            matched_tokens = doc_tokens[start:start + cand_len]
-            selected_in_match = any(
-                text.lower() == selected_word for text, _ in matched_tokens
-            )
-            if not selected_in_match:
+    cand_len = len(candidate)
+    needle = _needle(candidate)
+
+    pos = stream.find(needle)
+    while pos != -1:
+        start = token_at[pos]
+        pos = stream.find(needle, pos + 1)
+
+        # Found a match — check if selected word is in it
+        matched_tokens = [(t.text, t.idx) for t in doc[start:start + cand_len]]
+        selected_in_match = any(
+            text.lower() == selected_word for text, _ in matched_tokens
+        )
+        if not selected_in_match:
+            continue
+
+        # Build related list (all parts except the selected word — first occurrence only)
+        expression = " ".join(text for text, _ in matched_tokens)
+        related = []
+        selected_found = False
+        for text, offset in matched_tokens:
+            if not selected_found and text.lower() == selected_word:
+                selected_found = True
                 continue
+            related.append(TokenRef(text, offset))
 
-            # Build related list (all parts except the selected word — first occurrence only)
-            expression = " ".join(text for text, _ in matched_tokens)
-            related = []
-            selected_found = False
-            for text, offset in matched_tokens:
-                if not selected_found and text.lower() == selected_word:
-                    selected_found = True
-                    continue
-                related.append(TokenRef(text, offset))
-
-            return FixedExpressionInfo(expression=expression, related=related)
+        return FixedExpressionInfo(expression=expression, related=related)
 
     return None
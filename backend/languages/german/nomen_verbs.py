@@ -1,9 +1,10 @@
 """German Nomen-Verb-Verbindungen detection."""
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-import spacy
 from models import TokenRef
+from languages.base import lowered_lemmas, pos_tokens
 from languages.german.verbs import REFLEXIVE_PRONOUNS
 from languages.german.dict_store import (
     NOMEN_VERB, NOMEN_VERB_INDEX,
@@ -12,8 +13,11 @@ from languages.german.dict_store import (
     NOMEN_VERB_PREP_REFLEXIVE, NOMEN_VERB_PREP_REFLEXIVE_INDEX,
 )
 
+if TYPE_CHECKING:
+    import spacy
 
-@dataclass
+
+@dataclass(slots=True)
 class NomenVerbInfo:
     """Detected Nomen-Verb-Verbindung (e.g., "eine Frage stellen")."""
     expression: str         # canonical form: "eine Frage stellen"
@@ -21,7 +25,7 @@ class NomenVerbInfo:
 
 
 def detect_nomen_verb(
-    target, doc: spacy.tokens.Doc
+    target, doc: "spacy.tokens.Doc"
 ) -> NomenVerbInfo | None:
     """Detect Nomen-Verb-Verbindungen from context.
 
@@ -45,26 +49,27 @@ def detect_nomen_verb(
 
 
 def _match_from_noun(
-    noun_token, doc: spacy.tokens.Doc
+    noun_token, doc: "spacy.tokens.Doc"
 ) -> NomenVerbInfo | None:
     """User selected the noun — find a matching verb in the sentence."""
+    lemmas = lowered_lemmas(doc)
     noun_text = noun_token.text
     noun_lower = noun_text.lower()
     sich_token = _find_sich(doc)
 
     # First try reflexive prep + noun + verb (longest match, highest priority)
     if sich_token:
-        refl_prep_candidates = NOMEN_VERB_PREP_REFLEXIVE_INDEX.get(noun_lower, [])
+        refl_prep_candidates = NOMEN_VERB_PREP_REFLEXIVE_INDEX.get(noun_lower, ())
         if refl_prep_candidates:
-            verb_tokens = [t for t in doc if t.pos_ == "VERB"]
-            prep_tokens = [t for t in doc if t.pos_ == "ADP"]
+            verb_tokens = pos_tokens(doc, "VERB")
+            prep_tokens = pos_tokens(doc, "ADP")
             for prep_t in prep_tokens:
-                prep_lemma = prep_t.lemma_.lower()
+                prep_lemma = lemmas[prep_t.i]
                 for verb_t in verb_tokens:
-                    verb_lemma = verb_t.lemma_.lower()
+                    verb_lemma = lemmas[verb_t.i]
                     key = (prep_lemma, noun_text, verb_lemma)
-                    if key in NOMEN_VERB_PREP_REFLEXIVE:
-                        pattern = NOMEN_VERB_PREP_REFLEXIVE[key]
+                    pattern = NOMEN_VERB_PREP_REFLEXIVE.get(key)
+                    if pattern is not None:
                         related = [
                             TokenRef(t.text, t.idx)
                             for t in (sich_token, prep_t, verb_t)
@@ -73,18 +78,18 @@ def _match_from_noun(
                         return NomenVerbInfo(pattern, related)
 
     # Then try non-reflexive prep + noun + verb
-    prep_candidates = NOMEN_VERB_PREP_INDEX.get(noun_lower, [])
+    prep_candidates = NOMEN_VERB_PREP_INDEX.get(noun_lower, ())
     if prep_candidates:
-        verb_tokens = [t for t in doc if t.pos_ == "VERB"]
-        prep_tokens = [t for t in doc if t.pos_ == "ADP"]
+        verb_tokens = pos_tokens(doc, "VERB")
+        prep_tokens = pos_tokens(doc, "ADP")
 
         for prep_t in prep_tokens:
-            prep_lemma = prep_t.lemma_.lower()
+            prep_lemma = lemmas[prep_t.i]
             for verb_t in verb_tokens:
-                verb_lemma = verb_t.lemma_.lower()
+                verb_lemma = lemmas[verb_t.i]
                 key = (prep_lemma, noun_text, verb_lemma)
-                if key in NOMEN_VERB_PREP:
-                    pattern = NOMEN_VERB_PREP[key]
+                pattern = NOMEN_VERB_PREP.get(key)
+                if pattern is not None:
                     related = [
                         TokenRef(t.text, t.idx)
                         for t in (prep_t, verb_t)
@@ -93,20 +98,18 @@ def _match_from_noun(
                     return NomenVerbInfo(pattern, related)
 
     # Then try simple noun + verb (with or without sich)
-    candidates = NOMEN_VERB_INDEX.get(noun_lower, [])
+    candidates = NOMEN_VERB_INDEX.get(noun_lower, ())
     if not candidates:
         return None
 
-    for verb_t in doc:
-        if verb_t.pos_ != "VERB":
-            continue
-        verb_lemma = verb_t.lemma_.lower()
+    for verb_t in pos_tokens(doc, "VERB"):
+        verb_lemma = lemmas[verb_t.i]
         key = (noun_text, verb_lemma)
-        if key in NOMEN_VERB:
+        pattern = NOMEN_VERB.get(key)
+        if pattern is not None:
             is_reflexive = key in NOMEN_VERB_REFLEXIVE
             if is_reflexive and not sich_token:
                 continue  # skip: sich required but not present
-            pattern = NOMEN_VERB[key]
             related_tokens = [verb_t]
             if is_reflexive and sich_token:
                 related_tokens.append(sich_token)
@@ -117,28 +120,30 @@ def _match_from_noun(
 
 
 def _match_from_verb(
-    verb_token, doc: spacy.tokens.Doc
+    verb_token, doc: "spacy.tokens.Doc"
 ) -> NomenVerbInfo | None:
     """User selected the verb — find a matching noun in the sentence."""
-    verb_lemma = verb_token.lemma_.lower()
+    lemmas = lowered_lemmas(doc)
+    verb_lemma = lemmas[verb_token.i]
     sich_token = _find_sich(doc)
 
     # Collect all nouns in the sentence
-    noun_tokens = [t for t in doc if t.pos_ == "NOUN"]
+    noun_tokens = pos_tokens(doc, "NOUN")
     if not noun_tokens:
         return None
 
-    prep_tokens = [t for t in doc if t.pos_ == "ADP"]
+    prep_tokens = pos_tokens(doc, "ADP")
 
     # First try reflexive prep + noun + verb (longest match, highest priority)
     if sich_token:
         for noun_t in noun_tokens:
-            refl_prep_candidates = NOMEN_VERB_PREP_REFLEXIVE_INDEX.get(noun_t.text.lower(), [])
+            if noun_t.lower_ not in NOMEN_VERB_PREP_REFLEXIVE_INDEX:
+                continue  # no entry for this noun, skip the prep/verb scan
             for prep_t in prep_tokens:
-                prep_lemma = prep_t.lemma_.lower()
+                prep_lemma = lemmas[prep_t.i]
                 key = (prep_lemma, noun_t.text, verb_lemma)
-                if key in NOMEN_VERB_PREP_REFLEXIVE:
-                    pattern = NOMEN_VERB_PREP_REFLEXIVE[key]
+                pattern = NOMEN_VERB_PREP_REFLEXIVE.get(key)
+                if pattern is not None:
                     related = [
                         TokenRef(t.text, t.idx)
                         for t in (sich_token, prep_t, noun_t)
@@ -148,12 +153,13 @@ def _match_from_verb(
 
     # Then try non-reflexive prep + noun + verb
     for noun_t in noun_tokens:
-        prep_candidates = NOMEN_VERB_PREP_INDEX.get(noun_t.text.lower(), [])
+        if noun_t.lower_ not in NOMEN_VERB_PREP_INDEX:
+            continue  # no entry for this noun, skip the prep/verb scan
         for prep_t in prep_tokens:
-            prep_lemma = prep_t.lemma_.lower()
+            prep_lemma = lemmas[prep_t.i]
             key = (prep_lemma, noun_t.text, verb_lemma)
-            if key in NOMEN_VERB_PREP:
-                pattern = NOMEN_VERB_PREP[key]
+            pattern = NOMEN_VERB_PREP.get(key)
+            if pattern is not None:
                 related = [
                     TokenRef(t.text, t.idx)
                     for t in (prep_t, noun_t)
@@ -164,11 +170,11 @@ def _match_from_verb(
     # Then try simple noun + verb (with or without sich)
     for noun_t in noun_tokens:
         key = (noun_t.text, verb_lemma)
-        if key in NOMEN_VERB:
+        pattern = NOMEN_VERB.get(key)
+        if pattern is not None:
             is_reflexive = key in NOMEN_VERB_REFLEXIVE
             if is_reflexive and not sich_token:
                 continue  # skip: sich required but not present
-            pattern = NOMEN_VERB[key]
             related_tokens = [noun_t]
             if is_reflexive and sich_token:
                 related_tokens.append(sich_token)
@@ -178,32 +184,34 @@ def _match_from_verb(
     return None
 
 
-def _find_sich(doc: spacy.tokens.Doc):
+def _find_sich(doc: "spacy.tokens.Doc"):
     """Return the reflexive pronoun token (sich/mich/dich/uns/euch) if present, else None."""
     for t in doc:
-        if t.text.lower() in REFLEXIVE_PRONOUNS:
+        if t.lower_ in REFLEXIVE_PRONOUNS:
             return t
     return None
 
 
 def _match_from_sich(
-    sich_token, doc: spacy.tokens.Doc
+    sich_token, doc: "spacy.tokens.Doc"
 ) -> NomenVerbInfo | None:
     """User selected 'sich' — find a matching reflexive NVV in context."""
-    verb_tokens = [t for t in doc if t.pos_ == "VERB"]
-    noun_tokens = [t for t in doc if t.pos_ == "NOUN"]
-    prep_tokens = [t for t in doc if t.pos_ == "ADP"]
+    lemmas = lowered_lemmas(doc)
+    verb_tokens = pos_tokens(doc, "VERB")
+    noun_tokens = pos_tokens(doc, "NOUN")
+    prep_tokens = pos_tokens(doc, "ADP")
 
     # Try reflexive prep + noun + verb first (longest match)
     for noun_t in noun_tokens:
-        refl_prep_candidates = NOMEN_VERB_PREP_REFLEXIVE_INDEX.get(noun_t.text.lower(), [])
+        if noun_t.lower_ not in NOMEN_VERB_PREP_REFLEXIVE_INDEX:
+            continue  # no entry for this noun, skip the prep/verb scan
         for prep_t in prep_tokens:
-            prep_lemma = prep_t.lemma_.lower()
+            prep_lemma = lemmas[prep_t.i]
             for verb_t in verb_tokens:
-                verb_lemma = verb_t.lemma_.lower()
+                verb_lemma = lemmas[verb_t.i]
                 key = (prep_lemma, noun_t.text, verb_lemma)
-                if key in NOMEN_VERB_PREP_REFLEXIVE:
-                    pattern = NOMEN_VERB_PREP_REFLEXIVE[key]
+                pattern = NOMEN_VERB_PREP_REFLEXIVE.get(key)
+                if pattern is not None:
                     related = [
                         TokenRef(t.text, t.idx)
                         for t in (prep_t, noun_t, verb_t)
@@ -214,7 +222,7 @@ def _match_from_sich(
     # Then try simple reflexive noun + verb
     for noun_t in noun_tokens:
         for verb_t in verb_tokens:
-            key = (noun_t.text, verb_t.lemma_.lower())
+            key = (noun_t.text, lemmas[verb_t.i])
             if key in NOMEN_VERB_REFLEXIVE:
                 pattern = NOMEN_VERB[key]
                 related = [
@@ -1,17 +1,21 @@
 """German verb detection: separable verbs and compound tenses."""
 
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import simplemma
-import spacy
 from models import TokenRef
 
+if TYPE_CHECKING:
+    import spacy
+
 # All forms of the German reflexive pronoun
 REFLEXIVE_PRONOUNS = frozenset({"mich", "dich", "sich", "uns", "euch"})
 
 
 
-def detect_separable_verb(target_token, doc: spacy.tokens.Doc) -> tuple[str, TokenRef] | None:
+def detect_separable_verb(target_token, doc: "spacy.tokens.Doc") -> tuple[str, TokenRef] | None:
     """
     Detect if a verb is part of a separable verb construction.
 
@@ -32,9 +36,8 @@ def detect_separable_verb(target_token, doc: spacy.tokens.Doc) -> tuple[str, Tok
     if target_token.tag_ == "VVIZU":
         return None
 
-    for token in doc:
-        if token.head != target_token:
-            continue
+    # The particle is a dependent of the verb; walk its children, not the doc
+    for token in target_token.children:
         if token.tag_ == "PTKVZ" or token.dep_ == "svp":
             verb_lemma = simplemma.lemmatize(target_token.text, lang="de").lower()
             infinitive = token.text.lower() + verb_lemma
@@ -43,7 +46,7 @@ def detect_separable_verb(target_token, doc: spacy.tokens.Doc) -> tuple[str, Tok
     return None
 
 
-def detect_separable_verb_from_prefix(target_token, doc: spacy.tokens.Doc) -> tuple[str, str, dict, int] | None:
+def detect_separable_verb_from_prefix(target_token, doc: "spacy.tokens.Doc") -> tuple[str, str, dict, int] | None:
     """
     Detect full separable verb when user selects the prefix/particle.
 
@@ -79,7 +82,7 @@ def detect_separable_verb_from_prefix(target_token, doc: spacy.tokens.Doc) -> tu
 # German compound tense patterns
 # Note: ("werden", "Pres", "Part") is handled separately in detect_compound_tense()
 # because it is ambiguous between Vorgangspassiv Präsens and Futur II.
-GERMAN_COMPOUND_TENSES = {
+GERMAN_COMPOUND_TENSES = MappingProxyType({
     ("haben", "Pres", "Part"): "Perfekt (present perfect)",
     ("sein", "Pres", "Part"): "Perfekt (present perfect)",
     ("haben", "Past", "Part"): "Plusquamperfekt (past perfect)",
@@ -87,9 +90,22 @@ GERMAN_COMPOUND_TENSES = {
     ("werden", "Pres", "Inf"): "Futur I (future)",
     ("werden", "Past", "Part"): "Vorgangspassiv Präteritum (past passive)",
     ("werden", "Sub", "Inf"): "Konjunktiv II (subjunctive)",
-}
+})
 
-GERMAN_AUXILIARIES = {"haben", "sein", "werden"}
+GERMAN_AUXILIARIES = frozenset({"haben", "sein", "werden"})
+
+
+def _auxiliary_indices(doc: "spacy.tokens.Doc") -> list[int]:
+    """Indices of tokens with an auxiliary lemma (haben/sein/werden), in document order.
+
+    Cached in doc.user_data: several words of the same context are analyzed
+    against one Doc, and each compound-tense check only needs these tokens.
+    Indices rather than Tokens, which would tie the Doc into a reference cycle.
+    """
+    auxes = doc.user_data.get("_de_auxiliaries")
+    if auxes is None:
+        auxes = doc.user_data["_de_auxiliaries"] = [t.i for t in doc if t.lemma_ in GERMAN_AUXILIARIES]
+    return auxes
 
 
 def _are_syntactically_related(aux, main_verb) -> bool:
@@ -109,7 +125,7 @@ def _are_syntactically_related(aux, main_verb) -> bool:
     return False
 
 
-@dataclass
+@dataclass(slots=True)
 class CompoundTenseInfo:
     tense: str
     aux_text: str
@@ -118,29 +134,45 @@ class CompoundTenseInfo:
     aux_morph: dict
 
 
-def detect_compound_tense(main_verb, doc: spacy.tokens.Doc) -> CompoundTenseInfo | None:
+def detect_compound_tense(main_verb, doc: "spacy.tokens.Doc") -> CompoundTenseInfo | None:
     """Detect German compound tenses by analyzing auxiliary + main verb patterns.
 
     Args:
         main_verb: The resolved spaCy token the user selected
         doc: spaCy Doc of the context
     """
-    # Find the closest syntactically-related auxiliary
+    # Every tense pattern pairs the auxiliary with an infinitive or participle
+    # (a bare oc-dependent counts as a participle), so finite verbs, nouns etc.
+    # can't match; skip the auxiliary search for them
+    main_form = ",".join(main_verb.morph.get("VerbForm"))
+    if main_form not in ("Part", "Inf") and not (main_form == "" and main_verb.dep_ == "oc"):
+        return None
+
+    # Find the closest syntactically-related auxiliary. The same pass notes
+    # whether a related haben/sein exists, which Futur II detection needs when
+    # the best auxiliary is werden; stop as soon as nothing more can change.
     best_aux = None
-    for token in doc:
-        if token.lemma_ in GERMAN_AUXILIARIES and _are_syntactically_related(token, main_verb):
+    has_perfect_aux = False
+    for i in _auxiliary_indices(doc):
+        token = doc[i]
+        if not _are_syntactically_related(token, main_verb):
+            continue
+        if token.lemma_ in ("haben", "sein"):
+            has_perfect_aux = True
+        if best_aux is None:
             best_aux = token
+        if best_aux.lemma_ != "werden" or has_perfect_aux:
             break
 
     if not best_aux:
         return None
 
-    aux_morph = dict(best_aux.morph.to_dict())
-    main_morph = dict(main_verb.morph.to_dict())
+    # to_dict() already returns a fresh dict; it's kept on CompoundTenseInfo for
+    # the breakdown. Only VerbForm is needed from the main verb.
+    aux_morph = best_aux.morph.to_dict()
 
     aux_lemma = best_aux.lemma_
     aux_tense = aux_morph.get("Tense") or aux_morph.get("Mood", "")
-    main_form = main_morph.get("VerbForm", "")
 
     if aux_lemma in ("haben", "sein"):
         if main_form == "Inf":
@@ -155,12 +187,7 @@ def detect_compound_tense(main_verb, doc: spacy.tokens.Doc) -> CompoundTenseInfo
     # Futur II requires a second auxiliary (haben/sein) also linked to the main verb;
     # present passive has only werden.
     if key == ("werden", "Pres", "Part"):
-        has_second_aux = any(
-            token.lemma_ in {"haben", "sein"}
-            and _are_syntactically_related(token, main_verb)
-            for token in doc
-        )
-        tense = "Futur II (future perfect)" if has_second_aux else "Vorgangspassiv Präsens (present passive)"
+        tense = "Futur II (future perfect)" if has_perfect_aux else "Vorgangspassiv Präsens (present passive)"
     else:
         tense = GERMAN_COMPOUND_TENSES.get(key)
 
@@ -180,7 +207,7 @@ def detect_compound_tense(main_verb, doc: spacy.tokens.Doc) -> CompoundTenseInfo
 GERMAN_MODALS = frozenset({"können", "müssen", "sollen", "dürfen", "wollen", "mögen"})
 
 
-@dataclass
+@dataclass(slots=True)
 class ModalVerbInfo:
     """Detected modal verb + infinitive construction."""
     modal_text: str
@@ -194,7 +221,7 @@ class ModalVerbInfo:
     cluster: list[tuple[str, int]] = None
 
 
-def detect_modal_verb(target, doc: spacy.tokens.Doc) -> ModalVerbInfo | None:
+def detect_modal_verb(target, doc: "spacy.tokens.Doc") -> ModalVerbInfo | None:
     """Detect modal verb + infinitive constructions.
 
     Works when user selects either the modal verb (e.g., "will") or
@@ -266,7 +293,7 @@ def detect_modal_verb(target, doc: spacy.tokens.Doc) -> ModalVerbInfo | None:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class LassenInfo:
     """Detected lassen + verb construction."""
     verb_infinitive: str
@@ -280,8 +307,12 @@ class LassenInfo:
     sich_token_idx: int | None
 
 
+# Surface forms of lassen, matched even when the lemmatizer gets the lemma wrong
+_LASSEN_FORMS = frozenset({"lassen", "lässt", "lass", "lasst", "ließ", "ließen", "ließt", "ließest"})
+
+
 def detect_lassen_construction(
-    target, doc: spacy.tokens.Doc
+    target, doc: "spacy.tokens.Doc"
 ) -> LassenInfo | None:
     """
     Detect verb + lassen constructions.
@@ -297,13 +328,19 @@ def detect_lassen_construction(
         target: The resolved spaCy token the user selected
         doc: spaCy Doc of the full context
     """
+    # Only a lassen form or a verb can start a match; check that before
+    # copying out the sentence
+    selected_lassen = target.lemma_ == "lassen" or target.lower_ in _LASSEN_FORMS
+    if not selected_lassen and target.pos_ != "VERB":
+        return None
+
     # Scope all searches to the sentence containing the selected word
     sent_tokens = list(target.sent) if target.sent else list(doc)
 
     lassen_token = None
     verb_token = None
 
-    if target.lemma_ == "lassen" or target.text.lower() in ("lassen", "lässt", "lass", "lasst", "ließ", "ließen", "ließt", "ließest"):
+    if selected_lassen:
         # User selected a form of "lassen" — find the infinitive it governs
         lassen_token = target
         # Look for an infinitive verb that is syntactically related
@@ -347,7 +384,7 @@ def detect_lassen_construction(
     # Check for reflexive "sich ... lassen" within the same sentence
     sich_token = None
     for t in sent_tokens:
-        if t.text.lower() == "sich":
+        if t.lower_ == "sich":
             sich_token = t
             break
 
@@ -19,6 +19,8 @@ Behaviour gracefully degrades to v1 when GERMAN_NOUN_LEMMAS is empty,
 so the splitter still works on environments without migration 013.
 """
 
+from functools import lru_cache
+
 import simplemma
 
 from languages.german import compounds as v1_compounds
@@ -125,7 +127,8 @@ def _split_recursive(word: str, depth: int = 0) -> list[str] | None:
     else:
         min_score = 0.4
 
-    prefer_participle = any(word.lower().endswith(e) for e in v1_compounds.PARTICIPLE_ENDINGS)
+    word_lower = word.lower()
+    prefer_participle = word_lower.endswith(v1_compounds.PARTICIPLE_ENDINGS)
 
     split = v1_compounds._split_once(word, min_score, prefer_participle=prefer_participle)
     if not split:
@@ -136,7 +139,7 @@ def _split_recursive(word: str, depth: int = 0) -> list[str] | None:
     if len(left) < 3 or len(right) < 3:
         return None
 
-    if v1_compounds._is_derived_word(word, [left, right]):
+    if v1_compounds._is_derived_word(word, [left, right], word_lower):
         return None
 
     cleaned_left = _noun_aware_clean_part(left)
@@ -146,31 +149,25 @@ def _split_recursive(word: str, depth: int = 0) -> list[str] | None:
     # and is checked as-is (it's almost always already a clean noun).
     left_known = (
         _is_known_noun(cleaned_left)
-        or simplemma.is_known(cleaned_left, lang="de")
-        or simplemma.is_known(cleaned_left + "n", lang="de")
-        or simplemma.is_known(cleaned_left + "en", lang="de")
+        or v1_compounds._is_known(cleaned_left)
+        or v1_compounds._is_known(cleaned_left + "n")
+        or v1_compounds._is_known(cleaned_left + "en")
     )
     right_known = (
         _is_known_noun(right)
-        or simplemma.is_known(right, lang="de")
+        or v1_compounds._is_known(right)
     )
     if not left_known or not right_known:
         return None
 
     left = cleaned_left
 
-    result: list[str] = []
-    if len(left) >= 8:  # try harder on shorter sub-parts than v1
-        sub = _split_recursive(left, depth + 1)
-        if sub:
-            result.extend(sub)
-        else:
-            result.append(left)
-    else:
-        result.append(left)
+    # Try harder on shorter sub-parts than v1. The recursive call hands back
+    # a fresh list, so the head can be appended to it directly.
+    sub = _split_recursive(left, depth + 1) if len(left) >= 8 else None
+    result = sub or [left]
     result.append(right)
-
-    return result if len(result) > 1 else None
+    return result
 
 
 def split_compound(word: str) -> list[str] | None:
@@ -190,4 +187,14 @@ def split_compound(word: str) -> list[str] | None:
     if GERMAN_NOUN_LEMMAS and _is_inflection_of_known_noun(word):
         return None
 
-    return _split_recursive(word)
+    parts = _split_top_cached(word)
+    return list(parts) if parts else None
+
+
+@lru_cache(maxsize=4096)
+def _split_top_cached(word: str) -> tuple[str, ...] | None:
+    """Memoized depth-0 split. The result depends on GERMAN_NOUN_LEMMAS,
+    so dict_store.load() clears this cache whenever it refills the set.
+    """
+    parts = _split_recursive(word)
+    return tuple(parts) if parts else None
@@ -16,12 +16,15 @@ The third tier is the fallback for short imperatives like "Geh!" /
 """
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import simplemma
-import spacy
 
+if TYPE_CHECKING:
+    import spacy
 
-@dataclass
+
+@dataclass(slots=True)
 class ImperativeInfo:
     """Detected imperative verb."""
     surface: str
@@ -35,7 +38,7 @@ def _morph_has(token, key: str, value: str) -> bool:
     return value in (token.morph.get(key) or [])
 
 
-def _is_imperative_token(token, doc: spacy.tokens.Doc) -> bool:
+def _is_imperative_token(token, doc: "spacy.tokens.Doc") -> bool:
     """Return True if the token is (or is mis-tagged as) an imperative verb."""
     if token.tag_ in ("VVIMP", "VAIMP"):
         return True
@@ -82,7 +85,7 @@ def _person_form(token) -> str:
     return "du"
 
 
-def detect_imperative(target, doc: spacy.tokens.Doc) -> ImperativeInfo | None:
+def detect_imperative(target, doc: "spacy.tokens.Doc") -> ImperativeInfo | None:
     if not _is_imperative_token(target, doc):
         return None
 
@@ -19,12 +19,15 @@ This is morphology-only — no DB data needed.
 """
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import simplemma
-import spacy
 
+if TYPE_CHECKING:
+    import spacy
 
-@dataclass
+
+@dataclass(slots=True)
 class KonjunktivIInfo:
     """Detected Konjunktiv I verb form."""
     surface: str
@@ -93,7 +96,7 @@ def _is_konjunktiv_eins(token) -> bool:
     return False
 
 
-def detect_konjunktiv_eins(target, doc: spacy.tokens.Doc) -> KonjunktivIInfo | None:
+def detect_konjunktiv_eins(target, doc: "spacy.tokens.Doc") -> KonjunktivIInfo | None:
     if not _is_konjunktiv_eins(target):
         return None
 
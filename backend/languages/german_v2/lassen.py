@@ -9,13 +9,17 @@ governing verb, which silently misses these cases.
 This wrapper corrects the lemma at lookup time without modifying v1.
 """
 
-import spacy
+from typing import TYPE_CHECKING
 
+import simplemma
 from languages.german.verbs import (
     detect_lassen_construction as _v1_detect_lassen,
     LassenInfo,
 )
 
+if TYPE_CHECKING:
+    import spacy
+
 
 # All surface forms of "lassen" we want to recognise as the lemma "lassen"
 _LASSEN_SURFACES = frozenset({
@@ -45,7 +49,7 @@ def _find_lassen_token(doc, exclude_idx: int | None = None):
             continue
         if t.lemma_ == "lassen":
             return t
-        if t.text.lower() in _LASSEN_SURFACES and t.pos_ in ("VERB", "AUX"):
+        if t.lower_ in _LASSEN_SURFACES and t.pos_ in ("VERB", "AUX"):
             return t
     return None
 
@@ -62,12 +66,12 @@ def _find_inf_verb(doc, exclude_idx: int | None = None):
 
 def _find_sich(doc):
     for t in doc:
-        if t.text.lower() == "sich":
+        if t.lower_ == "sich":
             return t
     return None
 
 
-def detect_lassen_construction(target, doc: spacy.tokens.Doc) -> LassenInfo | None:
+def detect_lassen_construction(target, doc: "spacy.tokens.Doc") -> LassenInfo | None:
     """V2 lassen detector — tolerant of spaCy's lemma quirk.
 
     Strategy:
@@ -94,7 +98,7 @@ def detect_lassen_construction(target, doc: spacy.tokens.Doc) -> LassenInfo | No
     for t in sent_tokens:
         if t.i == target.i:
             continue
-        if t.text.lower() in _LASSEN_SURFACES and t.pos_ in ("VERB", "AUX"):
+        if t.lower_ in _LASSEN_SURFACES and t.pos_ in ("VERB", "AUX"):
             lassen_token = t
             break
 
@@ -111,7 +115,6 @@ def detect_lassen_construction(target, doc: spacy.tokens.Doc) -> LassenInfo | No
     # spaCy lemma for the verb might also be wrong (e.g. would-be irregular);
     # use simplemma defensively.
     try:
-        import simplemma
         verb_infinitive = simplemma.lemmatize(target.text, lang="de") or target.lemma_ or target.text
     except Exception:
         verb_infinitive = target.lemma_ or target.text
@@ -18,13 +18,15 @@ dict_store.MODAL_PARTICLES at startup). This module is logic only:
 """
 
 from dataclasses import dataclass
-
-import spacy
+from typing import TYPE_CHECKING
 
 from languages.german.dict_store import MODAL_PARTICLES
 
+if TYPE_CHECKING:
+    import spacy
+
 
-@dataclass
+@dataclass(slots=True)
 class ParticleInfo:
     """Detected modal particle with its inferred reading."""
     particle_text: str
@@ -40,7 +42,7 @@ class ParticleInfo:
 _PARTICLE_OK_POS = {"PART", "ADV", "INTJ", ""}
 
 
-def _sentence_type(target_token, doc: spacy.tokens.Doc) -> str:
+def _sentence_type(target_token, doc: "spacy.tokens.Doc") -> str:
     """Infer the sentence type of the sentence containing target_token.
 
     Heuristics:
@@ -92,7 +94,7 @@ def _sentence_type(target_token, doc: spacy.tokens.Doc) -> str:
     return "declarative"
 
 
-def _looks_like_particle(target, doc: spacy.tokens.Doc) -> bool:
+def _looks_like_particle(target, doc: "spacy.tokens.Doc") -> bool:
     """Reject obvious non-particle uses for ambiguous lemmas.
 
     - 'denn' / 'aber' at the start of a clause OR after a comma → conjunction
@@ -130,7 +132,7 @@ def _looks_like_particle(target, doc: spacy.tokens.Doc) -> bool:
     return True
 
 
-def detect_modal_particle(target, doc: spacy.tokens.Doc) -> ParticleInfo | None:
+def detect_modal_particle(target, doc: "spacy.tokens.Doc") -> ParticleInfo | None:
     """Detect a German modal particle at the target token.
 
     Returns ParticleInfo when:
@@ -14,13 +14,15 @@ Pure morphology + dict lookup — data lives in `german_n_decl` /
 """
 
 from dataclasses import dataclass
-
-import spacy
+from typing import TYPE_CHECKING
 
 from languages.german.dict_store import N_DECL_LEMMAS
 
+if TYPE_CHECKING:
+    import spacy
+
 
-@dataclass
+@dataclass(slots=True)
 class NDeklinationInfo:
     """Detected n-Deklination usage."""
     surface: str               # 'Studenten', 'Menschen', …
@@ -29,7 +31,7 @@ class NDeklinationInfo:
     is_lemma_form: bool        # True iff surface == lemma (nom sg)
 
 
-def detect_n_declination(target, doc: spacy.tokens.Doc) -> NDeklinationInfo | None:
+def detect_n_declination(target, doc: "spacy.tokens.Doc") -> NDeklinationInfo | None:
     """Detect a weak masculine noun (n-Deklination).
 
     Fires when:
@@ -14,9 +14,10 @@ detection) is identical to v1 — only the noun key derivation changes.
 """
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-import spacy
 from models import TokenRef
+from languages.base import lowered_lemmas, pos_tokens
 from languages.german.verbs import REFLEXIVE_PRONOUNS
 from languages.german.dict_store import (
     NOMEN_VERB, NOMEN_VERB_INDEX,
@@ -25,8 +26,11 @@ from languages.german.dict_store import (
     NOMEN_VERB_PREP_REFLEXIVE, NOMEN_VERB_PREP_REFLEXIVE_INDEX,
 )
 
+if TYPE_CHECKING:
+    import spacy
 
-@dataclass
+
+@dataclass(slots=True)
 class NomenVerbInfo:
     """Detected Nomen-Verb-Verbindung (e.g., "eine Frage stellen")."""
     expression: str         # canonical form: "eine Frage stellen"
@@ -50,7 +54,7 @@ def _noun_keys(noun_token) -> list[str]:
     return out
 
 
-def detect_nomen_verb(target, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
+def detect_nomen_verb(target, doc: "spacy.tokens.Doc") -> NomenVerbInfo | None:
     """Detect Nomen-Verb-Verbindungen from context (lemma-first matching)."""
     if target.pos_ == "NOUN":
         return _match_from_noun(target, doc)
@@ -61,8 +65,9 @@ def detect_nomen_verb(target, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
     return None
 
 
-def _match_from_noun(noun_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
+def _match_from_noun(noun_token, doc: "spacy.tokens.Doc") -> NomenVerbInfo | None:
     """User selected the noun — find a matching verb in the sentence."""
+    lemmas = lowered_lemmas(doc)
     sich_token = _find_sich(doc)
 
     for noun_key in _noun_keys(noun_token):
@@ -70,15 +75,15 @@ def _match_from_noun(noun_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
 
         # 1) Reflexive prep + noun + verb (longest match, highest priority)
         if sich_token and NOMEN_VERB_PREP_REFLEXIVE_INDEX.get(noun_lower):
-            verb_tokens = [t for t in doc if t.pos_ == "VERB"]
-            prep_tokens = [t for t in doc if t.pos_ == "ADP"]
+            verb_tokens = pos_tokens(doc, "VERB")
+            prep_tokens = pos_tokens(doc, "ADP")
             for prep_t in prep_tokens:
-                prep_lemma = prep_t.lemma_.lower()
+                prep_lemma = lemmas[prep_t.i]
                 for verb_t in verb_tokens:
-                    verb_lemma = verb_t.lemma_.lower()
+                    verb_lemma = lemmas[verb_t.i]
                     key = (prep_lemma, noun_key, verb_lemma)
-                    if key in NOMEN_VERB_PREP_REFLEXIVE:
-                        pattern = NOMEN_VERB_PREP_REFLEXIVE[key]
+                    pattern = NOMEN_VERB_PREP_REFLEXIVE.get(key)
+                    if pattern is not None:
                         related = [
                             TokenRef(t.text, t.idx)
                             for t in (sich_token, prep_t, verb_t)
@@ -88,15 +93,15 @@ def _match_from_noun(noun_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
 
         # 2) Non-reflexive prep + noun + verb
         if NOMEN_VERB_PREP_INDEX.get(noun_lower):
-            verb_tokens = [t for t in doc if t.pos_ == "VERB"]
-            prep_tokens = [t for t in doc if t.pos_ == "ADP"]
+            verb_tokens = pos_tokens(doc, "VERB")
+            prep_tokens = pos_tokens(doc, "ADP")
             for prep_t in prep_tokens:
-                prep_lemma = prep_t.lemma_.lower()
+                prep_lemma = lemmas[prep_t.i]
                 for verb_t in verb_tokens:
-                    verb_lemma = verb_t.lemma_.lower()
+                    verb_lemma = lemmas[verb_t.i]
                     key = (prep_lemma, noun_key, verb_lemma)
-                    if key in NOMEN_VERB_PREP:
-                        pattern = NOMEN_VERB_PREP[key]
+                    pattern = NOMEN_VERB_PREP.get(key)
+                    if pattern is not None:
                         related = [
                             TokenRef(t.text, t.idx)
                             for t in (prep_t, verb_t)
@@ -108,16 +113,14 @@ def _match_from_noun(noun_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
         if not NOMEN_VERB_INDEX.get(noun_lower):
             continue
 
-        for verb_t in doc:
-            if verb_t.pos_ != "VERB":
-                continue
-            verb_lemma = verb_t.lemma_.lower()
+        for verb_t in pos_tokens(doc, "VERB"):
+            verb_lemma = lemmas[verb_t.i]
             key = (noun_key, verb_lemma)
-            if key in NOMEN_VERB:
+            pattern = NOMEN_VERB.get(key)
+            if pattern is not None:
                 is_reflexive = key in NOMEN_VERB_REFLEXIVE
                 if is_reflexive and not sich_token:
                     continue
-                pattern = NOMEN_VERB[key]
                 related_tokens = [verb_t]
                 if is_reflexive and sich_token:
                     related_tokens.append(sich_token)
@@ -127,26 +130,29 @@ def _match_from_noun(noun_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
     return None
 
 
-def _match_from_verb(verb_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
+def _match_from_verb(verb_token, doc: "spacy.tokens.Doc") -> NomenVerbInfo | None:
     """User selected the verb — find a matching noun in the sentence."""
-    verb_lemma = verb_token.lemma_.lower()
+    lemmas = lowered_lemmas(doc)
+    verb_lemma = lemmas[verb_token.i]
     sich_token = _find_sich(doc)
 
-    noun_tokens = [t for t in doc if t.pos_ == "NOUN"]
+    noun_tokens = pos_tokens(doc, "NOUN")
     if not noun_tokens:
         return None
 
-    prep_tokens = [t for t in doc if t.pos_ == "ADP"]
+    prep_tokens = pos_tokens(doc, "ADP")
 
     # 1) Reflexive prep + noun + verb
     if sich_token:
         for noun_t in noun_tokens:
             for noun_key in _noun_keys(noun_t):
+                if noun_key.lower() not in NOMEN_VERB_PREP_REFLEXIVE_INDEX:
+                    continue
                 for prep_t in prep_tokens:
-                    prep_lemma = prep_t.lemma_.lower()
+                    prep_lemma = lemmas[prep_t.i]
                     key = (prep_lemma, noun_key, verb_lemma)
-                    if key in NOMEN_VERB_PREP_REFLEXIVE:
-                        pattern = NOMEN_VERB_PREP_REFLEXIVE[key]
+                    pattern = NOMEN_VERB_PREP_REFLEXIVE.get(key)
+                    if pattern is not None:
                         related = [
                             TokenRef(t.text, t.idx)
                             for t in (sich_token, prep_t, noun_t)
@@ -157,11 +163,13 @@ def _match_from_verb(verb_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
     # 2) Non-reflexive prep + noun + verb
     for noun_t in noun_tokens:
         for noun_key in _noun_keys(noun_t):
+            if noun_key.lower() not in NOMEN_VERB_PREP_INDEX:
+                continue
             for prep_t in prep_tokens:
-                prep_lemma = prep_t.lemma_.lower()
+                prep_lemma = lemmas[prep_t.i]
                 key = (prep_lemma, noun_key, verb_lemma)
-                if key in NOMEN_VERB_PREP:
-                    pattern = NOMEN_VERB_PREP[key]
+                pattern = NOMEN_VERB_PREP.get(key)
+                if pattern is not None:
                     related = [
                         TokenRef(t.text, t.idx)
                         for t in (prep_t, noun_t)
@@ -173,11 +181,11 @@ def _match_from_verb(verb_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
     for noun_t in noun_tokens:
         for noun_key in _noun_keys(noun_t):
             key = (noun_key, verb_lemma)
-            if key in NOMEN_VERB:
+            pattern = NOMEN_VERB.get(key)
+            if pattern is not None:
                 is_reflexive = key in NOMEN_VERB_REFLEXIVE
                 if is_reflexive and not sich_token:
                     continue
-                pattern = NOMEN_VERB[key]
                 related_tokens = [noun_t]
                 if is_reflexive and sich_token:
                     related_tokens.append(sich_token)
@@ -187,30 +195,33 @@ def _match_from_verb(verb_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
     return None
 
 
-def _find_sich(doc: spacy.tokens.Doc):
+def _find_sich(doc: "spacy.tokens.Doc"):
     """Return the reflexive pronoun token if present, else None."""
     for t in doc:
-        if t.text.lower() in REFLEXIVE_PRONOUNS:
+        if t.lower_ in REFLEXIVE_PRONOUNS:
             return t
     return None
 
 
-def _match_from_sich(sich_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
+def _match_from_sich(sich_token, doc: "spacy.tokens.Doc") -> NomenVerbInfo | None:
     """User selected 'sich' — find a matching reflexive NVV in context."""
-    verb_tokens = [t for t in doc if t.pos_ == "VERB"]
-    noun_tokens = [t for t in doc if t.pos_ == "NOUN"]
-    prep_tokens = [t for t in doc if t.pos_ == "ADP"]
+    lemmas = lowered_lemmas(doc)
+    verb_tokens = pos_tokens(doc, "VERB")
+    noun_tokens = pos_tokens(doc, "NOUN")
+    prep_tokens = pos_tokens(doc, "ADP")
 
     # 1) Reflexive prep + noun + verb
     for noun_t in noun_tokens:
         for noun_key in _noun_keys(noun_t):
+            if noun_key.lower() not in NOMEN_VERB_PREP_REFLEXIVE_INDEX:
+                continue
             for prep_t in prep_tokens:
-                prep_lemma = prep_t.lemma_.lower()
+                prep_lemma = lemmas[prep_t.i]
                 for verb_t in verb_tokens:
-                    verb_lemma = verb_t.lemma_.lower()
+                    verb_lemma = lemmas[verb_t.i]
                     key = (prep_lemma, noun_key, verb_lemma)
-                    if key in NOMEN_VERB_PREP_REFLEXIVE:
-                        pattern = NOMEN_VERB_PREP_REFLEXIVE[key]
+                    pattern = NOMEN_VERB_PREP_REFLEXIVE.get(key)
+                    if pattern is not None:
                         related = [
                             TokenRef(t.text, t.idx)
                             for t in (prep_t, noun_t, verb_t)
@@ -222,7 +233,7 @@ def _match_from_sich(sich_token, doc: spacy.tokens.Doc) -> NomenVerbInfo | None:
     for noun_t in noun_tokens:
         for noun_key in _noun_keys(noun_t):
             for verb_t in verb_tokens:
-                key = (noun_key, verb_t.lemma_.lower())
+                key = (noun_key, lemmas[verb_t.i])
                 if key in NOMEN_VERB_REFLEXIVE:
                     pattern = NOMEN_VERB[key]
                     related = [
@@ -22,7 +22,7 @@ from typing import Callable
 from languages.base import LanguageAnalysis
 
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     phenomenon: str
     confidence: float
@@ -15,17 +15,20 @@ Pure morphology — no DB data.
 """
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import simplemma
-import spacy
 from models import TokenRef
 
+if TYPE_CHECKING:
+    import spacy
+
 
 # Introducers that head a zu-infinitive purpose/manner clause
 _INTRODUCERS = {"um", "ohne", "statt", "anstatt"}
 
 
-@dataclass
+@dataclass(slots=True)
 class ZuInfInfo:
     """Detected zu-Infinitiv construction."""
     infinitive: str            # the infinitive verb's lemma
@@ -39,17 +42,17 @@ def _is_fused_zu_infinitive(token) -> bool:
     return token.tag_ == "VVIZU"
 
 
-def _find_introducer(verb_token, doc: spacy.tokens.Doc):
+def _find_introducer(verb_token, doc: "spacy.tokens.Doc"):
     """Return the (introducer_token, zu_token | None) pair for a zu-inf clause, or (None, None)."""
     sent = verb_token.sent if verb_token.sent is not None else doc
     sent_tokens = list(sent)
     # Walk left from the verb looking for "zu" then an introducer
     zu_token = None
     for t in reversed([x for x in sent_tokens if x.i < verb_token.i]):
-        if zu_token is None and t.text.lower() == "zu":
+        if zu_token is None and t.lower_ == "zu":
             zu_token = t
             continue
-        if zu_token is not None and t.text.lower() in _INTRODUCERS:
+        if zu_token is not None and t.lower_ in _INTRODUCERS:
             return (t, zu_token)
         # If we see a non-zu non-introducer non-punct between, give up
         if zu_token is not None and not t.is_punct:
@@ -57,7 +60,7 @@ def _find_introducer(verb_token, doc: spacy.tokens.Doc):
     return (None, zu_token)
 
 
-def detect_zu_infinitive(target, doc: spacy.tokens.Doc) -> ZuInfInfo | None:
+def detect_zu_infinitive(target, doc: "spacy.tokens.Doc") -> ZuInfInfo | None:
     """Detect a zu-Infinitiv construction at the target token.
 
     Selection points the user might click:
@@ -87,7 +90,7 @@ def detect_zu_infinitive(target, doc: spacy.tokens.Doc) -> ZuInfInfo | None:
         # Look for "zu" immediately or within 2 tokens before
         zu_token = None
         for t in reversed([x for x in sent_tokens if x.i < target.i]):
-            if t.text.lower() == "zu":
+            if t.lower_ == "zu":
                 zu_token = t
                 break
             if not t.is_punct:
@@ -136,14 +139,14 @@ def detect_zu_infinitive(target, doc: spacy.tokens.Doc) -> ZuInfInfo | None:
             if t.i <= target.i:
                 continue
             if t.tag_ == "VVIZU":
-                infinitive = simplemma.lemmatize(t.text.lower(), lang="de") or t.lemma_ or t.text
+                infinitive = simplemma.lemmatize(t.lower_, lang="de") or t.lemma_ or t.text
                 return ZuInfInfo(
                     infinitive=infinitive.lower(),
                     surface=f"{target.text} {t.text}",
                     introducer=target.text.lower(),
                     related=[TokenRef(t.text, t.idx)],
                 )
-            if t.text.lower() == "zu" and t.tag_ == "PTKZU":
+            if t.lower_ == "zu" and t.tag_ == "PTKZU":
                 # Look for Inf immediately after
                 verb = next(
                     (x for x in sent_tokens
@@ -23,11 +23,14 @@ cases the Perfekt detector would have mislabeled.
 """
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import simplemma
-import spacy
 from models import TokenRef
 
+if TYPE_CHECKING:
+    import spacy
+
 
 # Common German verbs that take "sein" in Perfekt (intransitive, motion,
 # state-change). Used as a negative filter — sein + their Partizip II is
@@ -45,7 +48,7 @@ _SEIN_AUX_INTRANSITIVE = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ZustandspassivInfo:
     """Detected sein + Partizip II as a state."""
     sein_text: str             # 'ist' / 'sind' / 'war' / 'waren' / …
@@ -55,7 +58,7 @@ class ZustandspassivInfo:
     verb_lemma: str            # 'schließen' / 'öffnen' / …
 
 
-def _find_sein(doc: spacy.tokens.Doc, target):
+def _find_sein(doc: "spacy.tokens.Doc", target):
     """Return the closest finite 'sein' in the same sentence, or None."""
     sent = target.sent if target.sent is not None else doc
     for t in sent:
@@ -64,7 +67,7 @@ def _find_sein(doc: spacy.tokens.Doc, target):
     return None
 
 
-def _find_participle(doc: spacy.tokens.Doc, target):
+def _find_participle(doc: "spacy.tokens.Doc", target):
     """Return the Partizip II in the same sentence, or None."""
     sent = target.sent if target.sent is not None else doc
     for t in sent:
@@ -76,7 +79,7 @@ def _find_participle(doc: spacy.tokens.Doc, target):
     return None
 
 
-def detect_zustandspassiv(target, doc: spacy.tokens.Doc) -> ZustandspassivInfo | None:
+def detect_zustandspassiv(target, doc: "spacy.tokens.Doc") -> ZustandspassivInfo | None:
     """Detect sein + Partizip II as Zustandspassiv.
 
     Selection points:
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenRef:
     """Reference to a token in context (text + character offset)."""
     text: str
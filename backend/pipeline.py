@@ -2,7 +2,7 @@ import logging
 import time
 from dataclasses import dataclass
 
-from analyzer import analyze_word
+from analyzer import analyze_word, detect_language_for_request
 from breakdown import generate_breakdown
 from translator import translate_smart, translate_simple
 from languages import get_language
@@ -85,11 +85,9 @@ def translate_pipeline(
     # Smart mode - full pipeline
     log.info("[PIPELINE] Mode: smart - starting full pipeline")
 
-    # Step 1: Analyze word
-    log.info("[STEP 1] Analyzing word with spaCy...")
-    with TimingBlock("Step 1: analyze_word"):
-        analysis = analyze_word(text, context, source_lang, text_offset=text_offset)
-    detected_lang = analysis.lang
+    # Resolve the language once for the request; the cache key needs it, so a
+    # full cache hit skips the spaCy analysis entirely
+    detected_lang = detect_language_for_request(text, context) if source_lang == "auto" else source_lang
 
     # Check cache - full hit (same word+context)
     cached = cache.get(text, context, detected_lang, target_lang)
@@ -108,6 +106,11 @@ def translate_pipeline(
             verb_variant=cached.verb_variant,
         )
 
+    # Step 1: Analyze word
+    log.info("[STEP 1] Analyzing word with spaCy...")
+    with TimingBlock("Step 1: analyze_word"):
+        analysis = analyze_word(text, context, detected_lang, text_offset=text_offset)
+
     # Check if context translation is cached (different word, same context)
     cached_context_translation = cache.get_context(context, detected_lang, target_lang) if context else None
     if cached_context_translation:
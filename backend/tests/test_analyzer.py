@@ -0,0 +1,156 @@
+"""
+Tests for analyzer plumbing: language detection and model loading.
+
+These don't depend on the German model's output; detectors are replaced
+with fakes so the tests pin the wiring, not linguistic results.
+"""
+
+import logging
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import analyzer
+
+
+class FakeLidModel:
+    """Stand-in for a fastText language-id model."""
+
+    def __init__(self, label="__label__de"):
+        self.label = label
+        self.calls = []
+
+    def predict(self, text, k=1):
+        self.calls.append(text)
+        return [self.label], [0.99]
+
+
+@pytest.fixture
+def fresh_detection(monkeypatch):
+    """Start from langdetect with an empty detection cache, and restore after."""
+    monkeypatch.setattr(analyzer, "_lid_model", None)
+    analyzer._detect_cached.cache_clear()
+    yield
+    analyzer._detect_cached.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# fastText language id
+# ---------------------------------------------------------------------------
+class TestFastTextDetection:
+    """_detect_cached prefers the fastText model when one is loaded."""
+
+    def test_label_prefix_stripped(self, fresh_detection, monkeypatch):
+        model = FakeLidModel("__label__de")
+        monkeypatch.setattr(analyzer, "_lid_model", model)
+        assert analyzer._detect_cached("Das ist ein Haus") == "de"
+        assert model.calls == ["Das ist ein Haus"]
+
+    def test_no_path_keeps_langdetect(self, fresh_detection, monkeypatch):
+        monkeypatch.delenv(analyzer.LID_MODEL_PATH_ENV, raising=False)
+        analyzer._load_lid_model()
+        assert analyzer._lid_model is None
+
+    def test_fasttext_missing_falls_back(self, fresh_detection, monkeypatch, caplog):
+        monkeypatch.setenv(analyzer.LID_MODEL_PATH_ENV, "/models/lid.176.ftz")
+        monkeypatch.setattr(analyzer, "fasttext", None)
+        with caplog.at_level(logging.WARNING, logger="analyzer"):
+            analyzer._load_lid_model()
+        assert analyzer._lid_model is None
+        assert "fasttext isn't installed" in caplog.text
+
+    def test_load_failure_falls_back(self, fresh_detection, monkeypatch, caplog):
+        def load_model(path):
+            raise ValueError(f"{path} cannot be opened for loading!")
+
+        monkeypatch.setenv(analyzer.LID_MODEL_PATH_ENV, "/models/missing.ftz")
+        monkeypatch.setattr(analyzer, "fasttext", SimpleNamespace(load_model=load_model))
+        with caplog.at_level(logging.WARNING, logger="analyzer"):
+            analyzer._load_lid_model()
+        assert analyzer._lid_model is None
+        assert "Failed to load fastText model" in caplog.text
+
+    def test_loading_clears_langdetect_results(self, fresh_detection, monkeypatch):
+        monkeypatch.setattr(analyzer, "detect", lambda text: "en")
+        assert analyzer._detect_cached("Das ist ein Haus") == "en"
+
+        model = FakeLidModel("__label__de")
+        monkeypatch.setenv(analyzer.LID_MODEL_PATH_ENV, "/models/lid.176.ftz")
+        monkeypatch.setattr(analyzer, "fasttext", SimpleNamespace(load_model=lambda path: model))
+        analyzer._load_lid_model()
+
+        assert analyzer._lid_model is model
+        assert analyzer._detect_cached("Das ist ein Haus") == "de"
+
+
+# ---------------------------------------------------------------------------
+# detect_language input normalization
+# ---------------------------------------------------------------------------
+class TestDetectLanguage:
+    """detect_language normalizes its input before the cached detector."""
+
+    @pytest.fixture
+    def seen(self, fresh_detection, monkeypatch):
+        calls = []
+
+        def fake_detect(text):
+            calls.append(text)
+            return "de"
+
+        monkeypatch.setattr(analyzer, "detect", fake_detect)
+        return calls
+
+    def test_whitespace_collapsed(self, seen):
+        assert analyzer.detect_language("  Das   ist\n ein\tHaus ") == "de"
+        assert seen == ["Das ist ein Haus"]
+
+    def test_whitespace_variants_share_cache_entry(self, seen):
+        analyzer.detect_language("Das ist ein Haus")
+        analyzer.detect_language("Das  ist ein\nHaus")
+        assert seen == ["Das ist ein Haus"]
+
+    def test_truncated_to_max_chars(self, seen):
+        prefix = "Das ist ein Haus. " * 20
+        analyzer.detect_language(prefix + "Und hier geht es weiter.")
+        analyzer.detect_language(prefix + "Something else entirely.")
+        assert len(seen) == 1
+        assert len(seen[0]) == analyzer._DETECT_MAX_CHARS
+
+    def test_short_input_still_detected(self, seen):
+        # A lone German word like "zu" must not be forced to "en"
+        assert analyzer.detect_language("zu") == "de"
+        assert seen == ["zu"]
+
+    def test_detection_failure_defaults_to_en(self, fresh_detection, monkeypatch):
+        def fake_detect(text):
+            raise analyzer.LangDetectException(0, "No features in text.")
+
+        monkeypatch.setattr(analyzer, "detect", fake_detect)
+        assert analyzer.detect_language("   ") == "en"
+
+
+# ---------------------------------------------------------------------------
+# Model loading after fork
+# ---------------------------------------------------------------------------
+class TestPostForkLoad:
+    """get_model warns when a model is first loaded in a forked worker."""
+
+    @pytest.fixture
+    def no_models(self, monkeypatch):
+        loaded = object()
+        monkeypatch.setattr(analyzer, "_models", {})
+        monkeypatch.setattr(analyzer, "_load_model", lambda lang, name: loaded)
+        return loaded
+
+    def test_warns_after_fork(self, no_models, monkeypatch, caplog):
+        monkeypatch.setattr(analyzer, "_preload_pid", os.getpid() + 1)
+        with caplog.at_level(logging.WARNING, logger="analyzer"):
+            assert analyzer.get_model("de") is no_models
+        assert "after fork" in caplog.text
+
+    def test_no_warning_in_preloading_process(self, no_models, monkeypatch, caplog):
+        monkeypatch.setattr(analyzer, "_preload_pid", os.getpid())
+        with caplog.at_level(logging.WARNING, logger="analyzer"):
+            assert analyzer.get_model("de") is no_models
+        assert "after fork" not in caplog.text
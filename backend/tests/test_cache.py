@@ -0,0 +1,103 @@
+"""
+Tests for the Redis translation cache: key format and hit/miss counters.
+
+Redis is replaced by an in-memory stand-in, so no server is needed.
+"""
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+import cache as cache_module
+from cache import CachedTranslation, TranslationCache
+
+
+class FakeRedis:
+    """Just enough of redis.Redis for TranslationCache."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def keys(self, pattern):
+        prefix = pattern.rstrip("*")
+        return [k for k in self.store if k.startswith(prefix)]
+
+    def delete(self, *keys):
+        for k in keys:
+            self.store.pop(k, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    r = FakeRedis()
+    monkeypatch.setattr(cache_module, "get_redis", lambda: r)
+    return r
+
+
+# ---------------------------------------------------------------------------
+# Key format — changing it silently invalidates every stored key
+# ---------------------------------------------------------------------------
+class TestKeyFormat:
+    """Pin the Redis key layout."""
+
+    def test_normalize_context(self):
+        assert cache_module._normalize_context("  Das  HAUS\nist   groß ") == "das haus ist groß"
+
+    def test_digest(self):
+        assert cache_module._digest("das haus ist groß:de:en") == "b4b22e7171ef43ae"
+
+    def test_word_key(self):
+        key = TranslationCache()._word_key("Haus", "  Das  HAUS\nist groß ", "de", "en")
+        assert key == "word:bb1348f1d72e26f9"
+
+    def test_context_key(self):
+        key = TranslationCache()._context_key("Das HAUS ist groß", "de", "en")
+        assert key == "ctx:b4b22e7171ef43ae"
+
+    def test_whitespace_and_case_share_key(self):
+        c = TranslationCache()
+        assert c._word_key("haus", "Das Haus ist groß", "de", "en") == c._word_key(
+            "HAUS", " das  HAUS ist\tgroß ", "de", "en"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Hit/miss counters
+# ---------------------------------------------------------------------------
+class TestStats:
+    """get() counts hits and misses, and stats() reports them."""
+
+    def test_hit_and_miss_counted(self, fake_redis):
+        c = TranslationCache()
+        entry = CachedTranslation(
+            translation="house", meaning=None, breakdown=None, context_translation=None
+        )
+        c.set("Haus", "Das Haus ist groß", "de", "en", entry)
+
+        assert c.get("Haus", "Das Haus ist groß", "de", "en") == entry
+        assert c.get("Baum", "Der Baum ist groß", "de", "en") is None
+
+        stats = c.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["words"] == 1
+        assert stats["contexts"] == 0
+
+    def test_stored_payload_round_trips(self, fake_redis):
+        c = TranslationCache()
+        entry = CachedTranslation(
+            translation="house", meaning="building", breakdown=None,
+            context_translation={"source": "Das Haus", "target": "The house"},
+        )
+        c.set("Haus", "Das Haus", "de", "en", entry)
+
+        raw = fake_redis.get(c._word_key("Haus", "Das Haus", "de", "en"))
+        assert json.loads(raw) == asdict(entry)
+        assert c.get_context("Das Haus", "de", "en") == "The house"
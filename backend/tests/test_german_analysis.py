@@ -5,6 +5,8 @@ Tests the deterministic analyzer layer (no LLM calls).
 Each test verifies: word_type classification, lemma resolution, and compound splitting.
 """
 
+import asyncio
+
 import pytest
 from analyzer import analyze_word
 from languages.german.compounds import split_compound
@@ -879,6 +881,42 @@ class TestSimpleWords:
         )
 
 
+# ---------------------------------------------------------------------------
+# Batch analysis — analyze_words() parses each context once
+# ---------------------------------------------------------------------------
+BATCH_CASES = [
+    # (word, context) — several words share a context to exercise deduplication
+    ("Frau", "Er hilft der Frau."),
+    ("hilft", "Er hilft der Frau."),
+    ("Kinder", "Die Kinder spielen."),
+    ("spielen", "Die Kinder spielen."),
+    ("sehr", "Das ist sehr gut."),
+]
+
+
+class TestBatchAnalysis:
+    """Test that batched analysis matches single-word analysis."""
+
+    def test_batch_matches_single(self):
+        from analyzer import analyze_words
+        batch = analyze_words([(word, context, "de") for word, context in BATCH_CASES])
+        assert len(batch) == len(BATCH_CASES)
+        for (word, context), result in zip(BATCH_CASES, batch):
+            single = analyze_word(word, context=context, source_lang="de")
+            assert (result.text, result.lemma, result.pos, result.word_type, result.morph) == (
+                single.text, single.lemma, single.pos, single.word_type, single.morph
+            ), f"'{word}' batch analysis differs from single analysis"
+
+    def test_async_matches_single(self):
+        from analyzer import analyze_word_async
+        for word, context in BATCH_CASES:
+            result = asyncio.run(analyze_word_async(word, context=context, source_lang="de"))
+            single = analyze_word(word, context=context, source_lang="de")
+            assert (result.text, result.lemma, result.pos, result.word_type, result.morph) == (
+                single.text, single.lemma, single.pos, single.word_type, single.morph
+            ), f"'{word}' async analysis differs from single analysis"
+
+
 # ---------------------------------------------------------------------------
 # Known issues / expected failures (from todos.txt)
 # ---------------------------------------------------------------------------